@@ -8,14 +8,11 @@ It handles data visualization, and data export.
 ########################################################################
 #                          Libraries import                            #
 
-from PySide6.QtCore import QObject, QTimer
+from PySide6.QtCore import QObject, QTimer, QThread, QMutex, QMutexLocker, QMetaObject, QCoreApplication, Qt, Slot
 from PySide6.QtGui import QPen
 import pyqtgraph as pg
 
 import numpy as np
-import pandas as pd
-import collections
-from decimal import Decimal
 
 import Settings
 from serial_manager import serial_manager
@@ -28,6 +25,100 @@ TIME_WINDOW = 500
 PEN_WIDTH = 1
 STIM_MIN = -100
 STIM_MAX = 100
+DRAW_INTERVAL = 16   # ms, ~60 Hz redraw
+REC_INITIAL_CAPACITY = 4096  # samples; the recording buffer doubles when full
+
+# Connect button stylesheets
+_QSS_CONNECTED = (
+    f"color: rgb{tuple(Settings.DarkSolarized[3])};\n"
+    f"background-color: rgb{tuple(Settings.DarkSolarized[11])};\n"
+    f"border: 1px solid rgb{tuple(Settings.DarkSolarized[14])};\n"
+    f"border-radius: 10px;"
+)
+_QSS_DISCONNECTED = (
+    f"color: rgb{tuple(Settings.DarkSolarized[14])};\n"
+    f"background-color: rgb{tuple(Settings.DarkSolarized[2])};\n"
+    f"border: 1px solid rgb{tuple(Settings.DarkSolarized[14])};\n"
+    f"border-radius: 10px;"
+)
+
+# Buffered samples are always finite and drawn as one connected line
+FAST_SETDATA = dict(skipFiniteCheck=True, connect='all')
+
+# Rows of the imaging ring buffer, in buff_data / recording order
+STIM, TRIGGER, FLUO1, CALCIUM1, VM1, FLUO2, CALCIUM2, VM2, FLUO3, CALCIUM3, VM3 = range(11)
+VM_ROWS = np.array([VM1, VM2, VM3])
+
+# Noise source for the calcium and fluorescence model
+_rng = np.random.default_rng()
+
+
+def calcium_fluorescence_step(Ca, spikes, eps_ca, eps_fluo, decay, baseline, rise, ca_noise,
+                              hill, kd, shot_noise, fluo_noise, gain, fluo_offset):
+    """
+    Advance the calcium indicator model by one imaging step.
+
+    Array arguments hold one entry per neuron; Ca is updated in place. gain is the
+    combined Laser * PMT * FluoScale factor.
+
+    Returns:
+        tuple: (SatNoise, Fluo) arrays for the new calcium state
+    """
+    Ca[:] = Ca - decay * Ca + baseline + rise * spikes + ca_noise * eps_ca
+
+    # Hill saturation of the indicator, shared by the noise and signal terms
+    h = Ca ** hill
+    sat = h / (h + kd)
+
+    SatNoise = np.sqrt(shot_noise * sat + fluo_noise) * eps_fluo
+    Fluo = kd * (gain * sat + SatNoise) + fluo_offset
+    return SatNoise, Fluo
+
+
+
+class ImagingWorker(QObject):
+    """
+    Runs the imaging acquisition step on its own thread.
+
+    Samples from serial_manager.data_received are delivered here through a queued
+    connection and collected until serial_manager.tick, which then processes the whole
+    chunk with ImagingGraph.update_plot under one lock, so the computation never blocks
+    the Qt event loop. The GUI thread only reads the ring buffer to redraw.
+    """
+    def __init__(self, graph):
+        super().__init__()
+        self.graph = graph
+        self.running = False
+        self._pending = []
+
+    @Slot()
+    def start(self):
+        self.running = True
+
+    @Slot()
+    def stop(self):
+        self.running = False
+        self._pending = []
+
+    @Slot(list)
+    def on_data_received(self, data):
+        """Slot for serial_manager.data_received signal: queue the sample until the next tick."""
+        if self.running and data and len(data) == 8:
+            self._pending.append(data)
+
+    @Slot()
+    def on_tick(self):
+        """Slot for serial_manager.tick signal: one acquisition step per queued sample."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        with QMutexLocker(self.graph._mutex):
+            for data in pending:
+                self.graph.ImagingData = data
+                self.graph.update_plot()
+            self.graph.last_valid_data = pending[-1]
+
 
 
 class ImagingGraph(QObject):
@@ -46,18 +137,60 @@ class ImagingGraph(QObject):
         self.data = ['0'] * 8
         self.last_valid_data = None
         self.record_flag = False
+        self._recording = False
         self.secondaryVB = None
 
+        # Recording buffer: (11, capacity) in ring buffer row order, first _rec_n columns recorded
+        self._rec = np.empty((11, REC_INITIAL_CAPACITY), dtype=np.float64)
+        self._rec_n = 0
+
         # Set ConnectionFlag in parent for use in Page201
         self.parent.ImagingConnectionFlag = False
 
 
-        # Start QTimer for plotting
-        self.imagingtimer = QTimer()
-        self.imagingtimer.timeout.connect(self.update_plot)
-
-        # Connect to serial_manager data signal
-        serial_manager.data_received.connect(self.on_data_received)
+        # Acquisition/computation runs on the worker thread; it shares the buffers with
+        # the GUI thread under _mutex
+        self._mutex = QMutex()
+        self._worker = ImagingWorker(self)
+        self._thread = QThread()
+        self._thread.setObjectName("ImagingWorker")
+        self._worker.moveToThread(self._thread)
+        self._thread.start()
+        QCoreApplication.instance().aboutToQuit.connect(self.shutdown)
+
+        # QTimer: redraw at display rate
+        self.drawtimer = QTimer()
+        self.drawtimer.timeout.connect(self.plot_curve)
+
+        # Imaging model parameters follow their sliders
+        for slider in (self.ui.Imaging_FrameRate_Slider, self.ui.Imaging_PMT_Slider, self.ui.Imaging_Laser_Slider,
+                       self.ui.Imaging_CalciumDecay_Slider, self.ui.Imaging_CalciumJump_Slider,
+                       self.ui.Imaging_CalciumBaseline_Slider, self.ui.Imaging_CalciumNoise_Slider,
+                       self.ui.Imaging_FluoScale_Slider, self.ui.Imaging_FluoOffset_Slider,
+                       self.ui.Imaging_FluoNoise_Slider, self.ui.Imaging_Hill_Slider,
+                       self.ui.Imaging_PhotoShotNoise_Slider, self.ui.Imaging_kd_Slider):
+            slider.valueChanged.connect(self.update_imaging_parameters)
+
+        # Curve visibility follows the Show checkboxes, read by plot_curve on every redraw
+        for checkbox, flag in ((self.ui.Imaging_Calcium1_Checkbox, '_show_ca1'),
+                               (self.ui.Imaging_Calcium2_Checkbox, '_show_ca2'),
+                               (self.ui.Imaging_Calcium3_Checkbox, '_show_ca3'),
+                               (self.ui.Imaging_Fluorescence1_Checkbox, '_show_fluo1'),
+                               (self.ui.Imaging_Fluorescence2_Checkbox, '_show_fluo2'),
+                               (self.ui.Imaging_Fluorescence3_Checkbox, '_show_fluo3'),
+                               (self.ui.Imaging_Vm1_Checkbox, '_show_vm1'),
+                               (self.ui.Imaging_Vm2_Checkbox, '_show_vm2'),
+                               (self.ui.Imaging_Vm3_Checkbox, '_show_vm3'),
+                               (self.ui.Imaging_Stimulus_Checkbox, '_show_stim')):
+            setattr(self, flag, checkbox.isChecked())
+            checkbox.toggled.connect(lambda checked, flag=flag: setattr(self, flag, checked))
+
+        # Recording follows the record button; stopping a recording exports it
+        self.ui.Imaging_DataRecording_Record_pushButton.toggled.connect(self._set_recording)
+
+        # Connect to serial_manager data signals; queued to the worker thread
+        serial_manager.data_received.connect(self._worker.on_data_received)
+        serial_manager.tick.connect(self._worker.on_tick)
 
 
 
@@ -73,39 +206,28 @@ class ImagingGraph(QObject):
 
         self.parent.ImagingConnectionFlag = True
 
-        self.imagingtimer.start() # add time frame from microsope here
+        QMetaObject.invokeMethod(self._worker, "start", Qt.QueuedConnection)
+        self.drawtimer.start(DRAW_INTERVAL)
 
 
     def disconnect(self):
         self.cleanup()
         self.parent.ImagingConnectionFlag = False
 
-        self.ui.Imaging_pushButton.setText("Connect Imaging screen to Spikeling screen")
-        self.ui.Imaging_pushButton.setStyleSheet("color: rgb" + str(tuple(Settings.DarkSolarized[14])) + ";\n"
-                                                 "background-color: rgb" + str(tuple(Settings.DarkSolarized[2])) + ";\n"
-                                                 "border: 1px solid rgb" + str(tuple(Settings.DarkSolarized[14])) + ";\n"
-                                                 "border-radius: 10px;"
-                                                )
+        self.ui.Imaging_ConnectButton.setText("Connect Imaging screen to Spikeling screen")
+        self.ui.Imaging_ConnectButton.setStyleSheet(_QSS_DISCONNECTED)
 
 
 
     # -------------------------------------------------------------------------
     # Data Handling
     # -------------------------------------------------------------------------
-    def on_data_received(self, data):
-        """Slot for serial_manager.data_received signal."""
-        if data and len(data) == 8:
-            self.ImagingData = data
-            self.last_valid_data = data
-
-
     def update_plot(self):
-        """Main loop: called periodically by QTimer."""
+        """Acquisition step: called by ImagingWorker for each sample, holding _mutex. Drawing runs on drawtimer."""
         try:
             self.compute_data()
             self.buff_data()
             self.save_plot_data()
-            self.plot_curve()
 
 
         except Exception as e:
@@ -124,15 +246,9 @@ class ImagingGraph(QObject):
         self.Imagingrecordflag = False
 
         # Parameters
-        self.CalciumData1 = 0.1
-        self.CalciumData2 = 0.1
-        self.CalciumData3 = 0.1
         self.SpikeThreshold = -20
         self.CalciumDecay = 0.05
         self.SpikeCa = 200.0
-        self.SatNoise1 = 0.0
-        self.SatNoise2 = 0.0
-        self.SatNoise3 = 0.0
         self.FluoScale = 1.0
         self.DissociationConstant = 300.0
         self.HillCoef = 4.0
@@ -140,68 +256,38 @@ class ImagingGraph(QObject):
         self.PMT = 1.0
         self.FluoOffset = 0.0
         self.update_interval = 10
+        self.update_imaging_parameters()
 
         # Buffers for calcium, fluorescence, Vm, stimulus, trigger
         self._Imaging_bufsize = int(TIME_WINDOW / SAMPLE_INTERVAL)
 
-        # Initialize data buffers
-        self.Stimdatabuffer = collections.deque([0.0] * self._Imaging_bufsize, self._Imaging_bufsize)
-        self.Triggerdatabuffer = collections.deque([0.0] * self._Imaging_bufsize, self._Imaging_bufsize)
-
-        self.Fluodatabuffer1 = collections.deque([0.0] * self._Imaging_bufsize, self._Imaging_bufsize)
-        self.Calciumdatabuffer1 = collections.deque([0.0] * self._Imaging_bufsize, self._Imaging_bufsize)
-        self.Vmdatabuffer1 = collections.deque([0.0] * self._Imaging_bufsize, self._Imaging_bufsize)
-
-        self.Fluodatabuffer2 = collections.deque([0.0] * self._Imaging_bufsize, self._Imaging_bufsize)
-        self.Calciumdatabuffer2 = collections.deque([0.0] * self._Imaging_bufsize, self._Imaging_bufsize)
-        self.Vmdatabuffer2 = collections.deque([0.0] * self._Imaging_bufsize, self._Imaging_bufsize)
-
-        self.Fluodatabuffer3 = collections.deque([0.0] * self._Imaging_bufsize, self._Imaging_bufsize)
-        self.Calciumdatabuffer3 = collections.deque([0.0] * self._Imaging_bufsize, self._Imaging_bufsize)
-        self.Vmdatabuffer3 = collections.deque([0.0] * self._Imaging_bufsize, self._Imaging_bufsize)
-
-        # Numpy arrays for plotting
-        self.Imagingx  = np.linspace(-TIME_WINDOW, 0.0, self._Imaging_bufsize)            # Create arrays of self._Imaging_bufsize length
-
-        self.yCalcium1 = np.zeros(self._Imaging_bufsize, dtype=float)
-        self.yCalcium2 = np.zeros(self._Imaging_bufsize, dtype=float)
-        self.yCalcium3 = np.zeros(self._Imaging_bufsize, dtype=float)
-        self.yFluo1    = np.zeros(self._Imaging_bufsize, dtype=float)
-        self.yFluo2    = np.zeros(self._Imaging_bufsize, dtype=float)
-        self.yFluo3    = np.zeros(self._Imaging_bufsize, dtype=float)
-        self.yVm1      = np.zeros(self._Imaging_bufsize, dtype=float)
-        self.yVm2      = np.zeros(self._Imaging_bufsize, dtype=float)
-        self.yVm3      = np.zeros(self._Imaging_bufsize, dtype=float)
-        self.yStim     = np.zeros(self._Imaging_bufsize, dtype=float)
-
-        # Internal calcium state for computation
-        self.CalciumData1 = 0.0
-        self.CalciumData2 = 0.0
-        self.CalciumData3 = 0.0
-        self.FluoData1 = 0.0
-        self.FluoData2 = 0.0
-        self.FluoData3 = 0.0
-
-        # Data recording arrays
-        self.imaging_data = []
-        for _ in range(12):
-            self.imaging_data.append([])
+        # Ring buffer, one row per signal. Each sample is written twice, at _head and
+        # _head + N, so the last N samples are always the contiguous slice [_head:_head + N].
+        # Display only: float32 halves the per-redraw copy; the model and recording stay float64
+        self._buf = np.zeros((11, 2 * self._Imaging_bufsize), dtype=np.float32)
+        self._sample = np.zeros(11)
+        self._head = 0
+
+        # Time axis for plotting: one point per buffered sample, newest at 0 ms. Built once and
+        # shared read-only by every curve
+        self.Imagingx = (np.arange(self._Imaging_bufsize, dtype=np.float32) - (self._Imaging_bufsize - 1)) * np.float32(SAMPLE_INTERVAL)
+        self.Imagingx.flags.writeable = False
+
+        # Internal calcium and fluorescence state for computation, one entry per neuron
+        self.Ca = np.zeros(3)
+        self.Fluo = np.zeros(3)
+        self.SatNoise = np.zeros(3)
+
+        # Data recording buffer
+        self._rec_n = 0
 
         # Set button appearance
         if self.ui.Imaging_ConnectButton.isChecked():
             self.ui.Imaging_ConnectButton.setText("Connected")
-            self.ui.Imaging_ConnectButton.setStyleSheet("color: rgb" + str(tuple(Settings.DarkSolarized[3])) + ";\n"
-                                                        "background-color: rgb" + str(tuple(Settings.DarkSolarized[11])) + ";\n"
-                                                        "border: 1px solid rgb" + str(tuple(Settings.DarkSolarized[14])) + ";\n"
-                                                        "border-radius: 10px;"
-                                                        )
+            self.ui.Imaging_ConnectButton.setStyleSheet(_QSS_CONNECTED)
         else:
             self.ui.Imaging_ConnectButton.setText("Connect Imaging screen to Spikeling screen")
-            self.ui.Imaging_ConnectButton.setStyleSheet("color: rgb" + str(tuple(Settings.DarkSolarized[14])) + ";\n"
-                                                        "background-color: rgb" + str(tuple(Settings.DarkSolarized[2])) + ";\n"
-                                                        "border: 1px solid rgb" + str(tuple(Settings.DarkSolarized[14])) + ";\n"
-                                                        "border-radius: 10px;"
-                                                        )
+            self.ui.Imaging_ConnectButton.setStyleSheet(_QSS_DISCONNECTED)
 
 
 
@@ -211,25 +297,32 @@ class ImagingGraph(QObject):
 
     def buff_data(self):
         try:
-            self.Stimdatabuffer.append(self.StimData)
-            self.Triggerdatabuffer.append(self.TriggerData)
+            sample = (self.StimData, self.TriggerData,
+                      self.Fluo[0], self.Ca[0], self.VmData1,
+                      self.Fluo[1], self.Ca[1], self.VmData2,
+                      self.Fluo[2], self.Ca[2], self.VmData3)
 
-            self.Fluodatabuffer1.append(self.FluoData1)
-            self.Calciumdatabuffer1.append(self.CalciumData1)
-            self.Vmdatabuffer1.append(self.VmData1)
+            self._sample[:] = sample
 
-            self.Fluodatabuffer2.append(self.FluoData2)
-            self.Calciumdatabuffer2.append(self.CalciumData2)
-            self.Vmdatabuffer2.append(self.VmData2)
-
-            self.Fluodatabuffer3.append(self.FluoData3)
-            self.Calciumdatabuffer3.append(self.CalciumData3)
-            self.Vmdatabuffer3.append(self.VmData3)
+            head = self._head
+            self._buf[:, head] = sample
+            self._buf[:, head + self._Imaging_bufsize] = sample
+            self._head = (head + 1) % self._Imaging_bufsize
 
         except Exception as e:
             print(f"Error in buff_data: {e}")
 
 
+    def _latest(self, age=0):
+        """Column of the ring buffer holding the sample written `age` ticks ago."""
+        return self._head - 1 - age + self._Imaging_bufsize
+
+
+    def _window(self):
+        """(11, N) view of the buffered samples, oldest first."""
+        return self._buf[:, self._head:self._head + self._Imaging_bufsize]
+
+
     def compute_data(self):
         try:
             # Extract floats
@@ -239,69 +332,54 @@ class ImagingGraph(QObject):
             self.TriggerData = self.ImagingData[7]
             self.StimData = self.ImagingData[1]
 
-            # Imaging parameters
-            self.FrameRate = self.ui.Imaging_FrameRate_Slider.value()
-            self.ImagingDelta = 1 / self.FrameRate * 10000  # imaging resolution in ms
-            self.PMT = self.ui.Imaging_PMT_Slider.value() / 100
-            self.Laser = self.ui.Imaging_Laser_Slider.value() / 100
-
-            # Calcium parameters
-            self.CalciumDecay = self.ui.Imaging_CalciumDecay_Slider.value() / 10000  # Indicator decay constant in ms
-            self.SpikeOccurence = 0  # number of spike at t
-            self.SpikeConcentrationRise = self.ui.Imaging_CalciumJump_Slider.value()  # calcicum concentration rise for each spike in micromolar
-            self.CalciumBaseline = self.ui.Imaging_CalciumBaseline_Slider.value() / 100  # in micromolar
-            self.NoiseScale = self.ui.Imaging_CalciumNoise_Slider.value() / 10  # sigmac
-
-            # Fluorescence parameters
-            self.FluoScale = self.ui.Imaging_FluoScale_Slider.value() / 10
-            self.FluoOffset = self.ui.Imaging_FluoOffset_Slider.value()
-            self.FluoNoiseScale = self.ui.Imaging_FluoNoise_Slider.value() / 10
-            self.HillCoef = self.ui.Imaging_Hill_Slider.value() / 100
-            self.PhotoShotNoise = self.ui.Imaging_PhotoShotNoise_Slider.value() / 10000 / 100
-            self.DissociationConstant = self.ui.Imaging_kd_Slider.value() * 10  # micromolar
-
-            if float(self.Vmdatabuffer1[-1]) >= self.SpikeThreshold and float(self.Vmdatabuffer1[-2]) <= self.SpikeThreshold:
-                self.SpikeOccurence1 = 1
-            else:
-                self.SpikeOccurence1 = 0
-
-            if float(self.Vmdatabuffer2[-1]) >= self.SpikeThreshold and float(self.Vmdatabuffer2[-2]) <= self.SpikeThreshold:
-                self.SpikeOccurence2 = 1
-            else:
-                self.SpikeOccurence2 = 0
-
-            if float(self.Vmdatabuffer3[-1]) >= self.SpikeThreshold and float(self.Vmdatabuffer3[-2]) <= self.SpikeThreshold:
-                self.SpikeOccurence3 = 1
-            else:
-                self.SpikeOccurence3 = 0
-
-            self.CalciumGaussianNoise1 = np.random.normal(0, 1)
-            self.CalciumData1 = self.CalciumData1 - self.CalciumDecay * self.CalciumData1 + self.CalciumBaseline + self.SpikeConcentrationRise * self.SpikeOccurence1 + self.NoiseScale * np.sqrt(self.ImagingDelta / 10000) * self.CalciumGaussianNoise1
-
-            self.CalciumGaussianNoise2 = np.random.normal(0, 1)
-            self.CalciumData2 = self.CalciumData2 - self.CalciumDecay * self.CalciumData2 + self.CalciumBaseline + self.SpikeConcentrationRise * self.SpikeOccurence2 + self.NoiseScale * np.sqrt(self.ImagingDelta / 10000) * self.CalciumGaussianNoise2
-
-            self.CalciumGaussianNoise3 = np.random.normal(0, 1)
-            self.CalciumData3 = self.CalciumData3 - self.CalciumDecay * self.CalciumData3 + self.CalciumBaseline + self.SpikeConcentrationRise * self.SpikeOccurence3 + self.NoiseScale * np.sqrt(self.ImagingDelta / 10000) * self.CalciumGaussianNoise3
-
-            self.FluoNoiseScale = self.FluoNoiseScale / 10000
-
-            self.FluoGaussianNoise1 = np.random.normal(0, 1)
-            self.SatNoise1 = np.sqrt(self.PhotoShotNoise * self.CalciumData1 ** self.HillCoef / (self.CalciumData1 ** self.HillCoef + self.DissociationConstant) + self.FluoNoiseScale) * self.FluoGaussianNoise1
-            self.FluoData1 = self.DissociationConstant * (self.Laser * self.PMT * self.FluoScale * (self.CalciumData1 ** self.HillCoef / (self.CalciumData1 ** self.HillCoef + self.DissociationConstant)) + self.SatNoise1) + self.FluoOffset
-
-            self.FluoGaussianNoise2 = np.random.normal(0, 1)
-            self.SatNoise2 = np.sqrt(self.PhotoShotNoise * self.CalciumData2 ** self.HillCoef / (self.CalciumData2 ** self.HillCoef + self.DissociationConstant) + self.FluoNoiseScale) * self.FluoGaussianNoise2
-            self.FluoData2 = self.DissociationConstant * (self.Laser * self.PMT * self.FluoScale * (self.CalciumData2 ** self.HillCoef / (self.CalciumData2 ** self.HillCoef + self.DissociationConstant)) + self.SatNoise2) + self.FluoOffset
-
-            self.FluoGaussianNoise3 = np.random.normal(0, 1)
-            self.SatNoise3 = np.sqrt(self.PhotoShotNoise * self.CalciumData3 ** self.HillCoef / (self.CalciumData3 ** self.HillCoef + self.DissociationConstant) + self.FluoNoiseScale) * self.FluoGaussianNoise3
-            self.FluoData3 = self.DissociationConstant * (self.Laser * self.PMT * self.FluoScale * (self.CalciumData3 ** self.HillCoef / ( self.CalciumData3 ** self.HillCoef + self.DissociationConstant)) + self.SatNoise3) + self.FluoOffset
+            # Spike onsets: Vm crossed the threshold between the last two samples, one entry per neuron.
+            # Evaluated as one branch-free array expression; the bool mask scales SpikeConcentrationRise.
+            Vm = self._buf[VM_ROWS[:, np.newaxis], (self._latest(1), self._latest())]
+            self.SpikeOccurence = (Vm[:, 1] >= self.SpikeThreshold) & (Vm[:, 0] <= self.SpikeThreshold)
+
+            # Calcium and fluorescence of the three neurons; one draw covers both noise terms
+            eps = _rng.standard_normal(6)
+            self.SatNoise, self.Fluo = calcium_fluorescence_step(
+                self.Ca, self.SpikeOccurence, eps[:3], eps[3:],
+                self.CalciumDecay, self.CalciumBaseline, self.SpikeConcentrationRise,
+                self.CalciumNoiseStep,
+                self.HillCoef, self.DissociationConstant, self.PhotoShotNoise, self.FluoNoiseScale,
+                self.FluoGain, self.FluoOffset)
 
         except Exception as e:
             print(f"Error in compute_data: {e}")
 
 
+    def update_imaging_parameters(self):
+        """
+        Read the imaging model parameters from their sliders.
+
+        Connected to every parameter slider's valueChanged signal, so compute_data
+        works from plain floats instead of querying Qt on each tick.
+        """
+        # Imaging parameters
+        self.FrameRate = self.ui.Imaging_FrameRate_Slider.value()
+        self.ImagingDelta = 1 / self.FrameRate * 10000  # imaging resolution in ms
+        self.PMT = self.ui.Imaging_PMT_Slider.value() / 100
+        self.Laser = self.ui.Imaging_Laser_Slider.value() / 100
+
+        # Calcium parameters
+        self.CalciumDecay = self.ui.Imaging_CalciumDecay_Slider.value() / 10000  # Indicator decay constant in ms
+        self.SpikeConcentrationRise = self.ui.Imaging_CalciumJump_Slider.value()  # calcicum concentration rise for each spike in micromolar
+        self.CalciumBaseline = self.ui.Imaging_CalciumBaseline_Slider.value() / 100  # in micromolar
+        self.NoiseScale = self.ui.Imaging_CalciumNoise_Slider.value() / 10  # sigmac
+        self.CalciumNoiseStep = self.NoiseScale * np.sqrt(self.ImagingDelta / 10000)  # noise amplitude per imaging step
+
+        # Fluorescence parameters
+        self.FluoScale = self.ui.Imaging_FluoScale_Slider.value() / 10
+        self.FluoOffset = self.ui.Imaging_FluoOffset_Slider.value()
+        self.FluoNoiseScale = self.ui.Imaging_FluoNoise_Slider.value() / 10 / 10000
+        self.HillCoef = self.ui.Imaging_Hill_Slider.value() / 100
+        self.PhotoShotNoise = self.ui.Imaging_PhotoShotNoise_Slider.value() / 10000 / 100
+        self.DissociationConstant = self.ui.Imaging_kd_Slider.value() * 10  # micromolar
+        self.FluoGain = self.Laser * self.PMT * self.FluoScale  # overall detection gain
+
+
     def set_plot(self):
         """
         Set up the plot widget and curves.
@@ -315,7 +393,7 @@ class ImagingGraph(QObject):
         pw.setLabel('left', 'Fluorescence  /  [Ca2+]    ', 'a.u.  /  µM')
         pw.setLabel('bottom', 'time', 'ms')
         pw.setLabel('right', 'Stimulus Intensity / Vm', 'a.u. / mV')
-        pw.setAntialiasing(True)
+        pw.setAntialiasing(False)
 
 
         # -----------------------------
@@ -327,30 +405,32 @@ class ImagingGraph(QObject):
         self.secondaryVB.setRange(yRange=[STIM_MIN, STIM_MAX])
         pw.getAxis("right").linkToView(self.secondaryVB)
 
-        # Create plot curves for calcium and fluorescence on the main plot with anti-aliasing
-        self.Calciumcurve1 = self.ui.Imaging_Oscilloscope_widget.plot(self.Imagingx, self.yCalcium1, pen=pg.mkPen(Settings.DarkSolarized[10], width=PEN_WIDTH, cosmetic=True))
+        window = self._window()
+
+        # Create plot curves for calcium and fluorescence on the main plot
+        self.Calciumcurve1 = self.ui.Imaging_Oscilloscope_widget.plot(self.Imagingx, window[CALCIUM1], pen=pg.mkPen(Settings.DarkSolarized[10], width=PEN_WIDTH, cosmetic=True))
         self.Calciumcurve1.clear()
-        self.Calciumcurve2 = self.ui.Imaging_Oscilloscope_widget.plot(self.Imagingx, self.yCalcium2, pen=pg.mkPen(Settings.DarkSolarized[9], width=PEN_WIDTH, cosmetic=True))
+        self.Calciumcurve2 = self.ui.Imaging_Oscilloscope_widget.plot(self.Imagingx, window[CALCIUM2], pen=pg.mkPen(Settings.DarkSolarized[9], width=PEN_WIDTH, cosmetic=True))
         self.Calciumcurve2.clear()
-        self.Calciumcurve3 = self.ui.Imaging_Oscilloscope_widget.plot(self.Imagingx, self.yCalcium3, pen=pg.mkPen(Settings.DarkSolarized[7], width=PEN_WIDTH, cosmetic=True))
+        self.Calciumcurve3 = self.ui.Imaging_Oscilloscope_widget.plot(self.Imagingx, window[CALCIUM3], pen=pg.mkPen(Settings.DarkSolarized[7], width=PEN_WIDTH, cosmetic=True))
         self.Calciumcurve3.clear()
 
-        self.Fluocurve1 = self.ui.Imaging_Oscilloscope_widget.plot(self.Imagingx, self.yFluo1, pen=pg.mkPen(Settings.DarkSolarized[4], width=PEN_WIDTH, cosmetic=True))
+        self.Fluocurve1 = self.ui.Imaging_Oscilloscope_widget.plot(self.Imagingx, window[FLUO1], pen=pg.mkPen(Settings.DarkSolarized[4], width=PEN_WIDTH, cosmetic=True))
         self.Fluocurve1.clear()
-        self.Fluocurve2 = self.ui.Imaging_Oscilloscope_widget.plot(self.Imagingx, self.yFluo2, pen=pg.mkPen([0, 255, 133], width=PEN_WIDTH, cosmetic=True))
+        self.Fluocurve2 = self.ui.Imaging_Oscilloscope_widget.plot(self.Imagingx, window[FLUO2], pen=pg.mkPen([0, 255, 133], width=PEN_WIDTH, cosmetic=True))
         self.Fluocurve2.clear()
-        self.Fluocurve3 = self.ui.Imaging_Oscilloscope_widget.plot(self.Imagingx, self.yFluo3, pen=pg.mkPen([133, 255, 0], width=PEN_WIDTH, cosmetic=True))
+        self.Fluocurve3 = self.ui.Imaging_Oscilloscope_widget.plot(self.Imagingx, window[FLUO3], pen=pg.mkPen([133, 255, 0], width=PEN_WIDTH, cosmetic=True))
         self.Fluocurve3.clear()
 
-        # Create plot curves for Vmand stimulus (secondary plot - right y-axis) with anti-aliasing
-        self.Vmcurve1 = pg.PlotCurveItem(self.Imagingx, self.yVm1, pen=pg.mkPen(Settings.DarkSolarized[3], width=PEN_WIDTH, cosmetic=True))
+        # Create plot curves for Vm and stimulus (secondary plot - right y-axis)
+        self.Vmcurve1 = pg.PlotDataItem(self.Imagingx, window[VM1], pen=pg.mkPen(Settings.DarkSolarized[3], width=PEN_WIDTH, cosmetic=True))
         self.Vmcurve1.clear()
-        self.Vmcurve2 = pg.PlotCurveItem(self.Imagingx, self.yVm2, pen=pg.mkPen(Settings.DarkSolarized[6], width=PEN_WIDTH, cosmetic=True))
+        self.Vmcurve2 = pg.PlotDataItem(self.Imagingx, window[VM2], pen=pg.mkPen(Settings.DarkSolarized[6], width=PEN_WIDTH, cosmetic=True))
         self.Vmcurve2.clear()
-        self.Vmcurve3 = pg.PlotCurveItem(self.Imagingx, self.yVm3, pen=pg.mkPen(Settings.DarkSolarized[8], width=PEN_WIDTH, cosmetic=True))
+        self.Vmcurve3 = pg.PlotDataItem(self.Imagingx, window[VM3], pen=pg.mkPen(Settings.DarkSolarized[8], width=PEN_WIDTH, cosmetic=True))
         self.Vmcurve3.clear()
 
-        self.Stimcurve = pg.PlotCurveItem(self.Imagingx, self.yStim, pen=pg.mkPen(Settings.DarkSolarized[5], width=PEN_WIDTH, cosmetic=True))
+        self.Stimcurve = pg.PlotDataItem(self.Imagingx, window[STIM], pen=pg.mkPen(Settings.DarkSolarized[5], width=PEN_WIDTH, cosmetic=True))
         self.Stimcurve.clear()
 
         # Add current and stimulus curves to the secondary plot (right y-axis)
@@ -359,11 +439,20 @@ class ImagingGraph(QObject):
         self.secondaryVB.addItem(self.Vmcurve3)
         self.secondaryVB.addItem(self.Stimcurve)
 
+        # Only draw the visible time window, peak-downsampled to the screen resolution
+        for curve in (self.Calciumcurve1, self.Calciumcurve2, self.Calciumcurve3,
+                      self.Fluocurve1, self.Fluocurve2, self.Fluocurve3,
+                      self.Vmcurve1, self.Vmcurve2, self.Vmcurve3, self.Stimcurve):
+            curve.setDownsampling(auto=True, method='peak')
+            curve.setClipToView(True)
+
         # Update secondary ViewBox when main plot resizes
         def update_views():
             self.secondaryVB.setGeometry(pw.getViewBox().sceneBoundingRect())
             self.secondaryVB.linkedViewChanged(pw.getViewBox(), self.secondaryVB.XAxis)
 
+        # Run once now and then on every resize
+        update_views()
         pw.getViewBox().sigResized.connect(update_views)
 
 
@@ -371,82 +460,63 @@ class ImagingGraph(QObject):
         """
         Update the plot curves with the latest data from buffers.
         """
-        try:
-            # Check if all required attributes are initialized
-            required_attrs = ['Imagingx', 'yCalcium1', 'yCalcium2', 'yCalcium3', 'yFluo1', 'yFluo2', 'yFluo3', 'yVm1', 'yVm2', 'yVm3', 'yStim'
-                              'Calciumcurve1', 'Calciumcurve2', 'Calciumcurve3', 'Fluocurve1', 'Fluocurve2', 'Fluocurve3', 'Vmcurve1', 'Vmcurve2', 'Vmcurve3', 'Stimcurve',
-                              'Calciumdatabuffer1', 'Calciumdatabuffer2', 'Calciumdatabuffer3', 'Fluodatabuffer1','Fluodatabuffer2', 'Fluodatabuffer3', 'Vmdatabuffer1', 'Vmdatabuffer2', 'Vmdatabuffer3', 'Stimdatabuffer']
-
-            # Plot calcium on the main plots
-            if self.ui.Imaging_Calcium1_Checkbox.isChecked():
-                self.yCalcium1[:] = self.Calciumdatabuffer1
-                self.Calciumcurve1.setData(self.Imagingx, self.yCalcium1)
-            else:
-                self.Calciumcurve1.clear()
-
-            if self.ui.Imaging_Calcium2_Checkbox.isChecked():
-                self.yCalcium2[:] = self.Calciumdatabuffer2
-                self.Calciumcurve2.setData(self.Imagingx, self.yCalcium2)
-            else:
-                self.Calciumcurve2.clear()
-
-            if self.ui.Imaging_Calcium3_Checkbox.isChecked():
-                self.yCalcium3[:] = self.Calciumdatabuffer3
-                self.Calciumcurve3.setData(self.Imagingx, self.yCalcium3)
-            else:
-                self.Calciumcurve3.clear()
-
-            # Plot fluorescence on the main plot
-            if self.ui.Imaging_Fluorescence1_Checkbox.isChecked():
-                self.yFluo1[:] = self.Fluodatabuffer1
-                self.Fluocurve1.setData(self.Imagingx, self.yFluo1)
-            else:
-                self.Fluocurve1.clear()
-
-            if self.ui.Imaging_Fluorescence2_Checkbox.isChecked():
-                self.yFluo2[:] = self.Fluodatabuffer2
-                self.Fluocurve2.setData(self.Imagingx, self.yFluo2)
-            else:
-                self.Fluocurve2.clear()
-
-            if self.ui.Imaging_Fluorescence3_Checkbox.isChecked():
-                self.yFluo3[:] = self.Fluodatabuffer3
-                self.Fluocurve3.setData(self.Imagingx, self.yFluo3)
-            else:
-                self.Fluocurve3.clear()
-
-            # Plot membrane potentials on the main plot
-            if self.ui.Imaging_Vm1_Checkbox.isChecked():
-                self.yVm1[:] = self.Vmdatabuffer1
-                self.Vmcurve1.setData(self.Imagingx, self.yVm1)
-            else:
-                self.Vmcurve1.clear()
-
-            if self.ui.Imaging_Vm2_Checkbox.isChecked():
-                self.yVm2[:] = self.Vmdatabuffer2
-                self.Vmcurve2.setData(self.Imagingx, self.yVm2)
-            else:
-                self.Vmcurve2.clear()
-
-            if self.ui.Imaging_Vm3_Checkbox.isChecked():
-                self.yVm3[:] = self.Vmdatabuffer3
-                self.Vmcurve3.setData(self.Imagingx, self.yVm3)
-            else:
-                self.Vmcurve3.clear()
-
-            # Plot stimulus on the main plot
-            if self.ui.Imaging_Stimulus_Checkbox.isChecked():
-                self.yStim[:] = self.Stimdatabuffer
-                self.Stimcurve.setData(self.Imagingx, self.yStim)
-            else:
-                self.Stimcurve.clear()
-
-            # Secondary ViewBox auto-syncs y-axis (current/stimulus)
-            self.secondaryVB.setGeometry(self.ui.Imaging_Oscilloscope_widget.getViewBox().sceneBoundingRect())
+        # Buffered samples, oldest first: copied under the lock as the worker keeps writing
+        with QMutexLocker(self._mutex):
+            window = self._window().copy()
 
+        # Plot calcium on the main plots
+        if self._show_ca1:
+            self.Calciumcurve1.setData(self.Imagingx, window[CALCIUM1], **FAST_SETDATA)
+        else:
+            self.Calciumcurve1.clear()
 
-        except Exception as e:
-            print(f"Error in plot_curve: {e}")
+        if self._show_ca2:
+            self.Calciumcurve2.setData(self.Imagingx, window[CALCIUM2], **FAST_SETDATA)
+        else:
+            self.Calciumcurve2.clear()
+
+        if self._show_ca3:
+            self.Calciumcurve3.setData(self.Imagingx, window[CALCIUM3], **FAST_SETDATA)
+        else:
+            self.Calciumcurve3.clear()
+
+        # Plot fluorescence on the main plot
+        if self._show_fluo1:
+            self.Fluocurve1.setData(self.Imagingx, window[FLUO1], **FAST_SETDATA)
+        else:
+            self.Fluocurve1.clear()
+
+        if self._show_fluo2:
+            self.Fluocurve2.setData(self.Imagingx, window[FLUO2], **FAST_SETDATA)
+        else:
+            self.Fluocurve2.clear()
+
+        if self._show_fluo3:
+            self.Fluocurve3.setData(self.Imagingx, window[FLUO3], **FAST_SETDATA)
+        else:
+            self.Fluocurve3.clear()
+
+        # Plot membrane potentials on the main plot
+        if self._show_vm1:
+            self.Vmcurve1.setData(self.Imagingx, window[VM1], **FAST_SETDATA)
+        else:
+            self.Vmcurve1.clear()
+
+        if self._show_vm2:
+            self.Vmcurve2.setData(self.Imagingx, window[VM2], **FAST_SETDATA)
+        else:
+            self.Vmcurve2.clear()
+
+        if self._show_vm3:
+            self.Vmcurve3.setData(self.Imagingx, window[VM3], **FAST_SETDATA)
+        else:
+            self.Vmcurve3.clear()
+
+        # Plot stimulus on the main plot
+        if self._show_stim:
+            self.Stimcurve.setData(self.Imagingx, window[STIM], **FAST_SETDATA)
+        else:
+            self.Stimcurve.clear()
 
 
 
@@ -454,69 +524,67 @@ class ImagingGraph(QObject):
     # Saving Data
     # -------------------------------------------------------------------------
 
-    def save_plot_data(self):
+    def _set_recording(self, checked):
         """
-        Save the latest buffer data and export them as CSV when recording is stopped.
+        Follow the record button, and export the data as CSV when recording is stopped.
         """
-        # If recording was on and is now turned off, save the data
-        if not self.ui.Imaging_DataRecording_Record_pushButton.isChecked() and self.record_flag:
-            self.export_data_to_csv()
-            self.record_flag = False
-            # Clear data arrays
-            for i in range(12):
-                self.imaging_data[i].clear()
+        with QMutexLocker(self._mutex):
+            self._recording = checked
+
+            # If recording was on and is now turned off, save the data
+            if not checked and self.record_flag:
+                self.export_data_to_csv()
+                self.record_flag = False
+                # Clear recording buffer
+                self._rec_n = 0
 
+
+    def save_plot_data(self):
+        """
+        Append the latest buffer data to the recording while recording is on.
+        """
         # If recording is on, append data to arrays
-        if self.ui.Imaging_DataRecording_Record_pushButton.isChecked():
+        if self._recording:
             self.record_flag = True
 
-            # Append latest data points to recording arrays
-            self.imaging_data[1].append(self.Stimdatabuffer[-1])
-            self.imaging_data[2].append(self.Triggerdatabuffer[-1])
-            self.imaging_data[3].append(self.Fluodatabuffer1[-1])
-            self.imaging_data[4].append(self.Calciumdatabuffer1[-1])
-            self.imaging_data[5].append(self.Vmdatabuffer1[-1])
-            self.imaging_data[6].append(self.Fluodatabuffer2[-1])
-            self.imaging_data[7].append(self.Calciumdatabuffer2[-1])
-            self.imaging_data[8].append(self.Vmdatabuffer2[-1])
-            self.imaging_data[9].append(self.Fluodatabuffer3[-1])
-            self.imaging_data[10].append(self.Calciumdatabuffer3[-1])
-            self.imaging_data[11].append(self.Vmdatabuffer3[-1])
+            # Append latest data point to the recording buffer, doubling its capacity when full
+            if self._rec_n == self._rec.shape[1]:
+                grown = np.empty((11, 2 * self._rec.shape[1]), dtype=np.float64)
+                grown[:, :self._rec_n] = self._rec
+                self._rec = grown
+
+            self._rec[:, self._rec_n] = self._sample
+            self._rec_n += 1
 
 
     def export_data_to_csv(self):
         """
         Export recorded data to a CSV file.
         """
-        # Create a numpy array for the dataset
-        ImagingDataset = np.empty([12, len(self.imaging_data[1])], dtype=float)
-
-        # Fill the dataset with recorded data
-        _interval = Decimal(str(SAMPLE_INTERVAL))
-        for i in range(len(self.imaging_data[1])):
-            ImagingDataset[0][i] = i * _interval
-            for j in range(1, 12):
-                ImagingDataset[j][i] = self.imaging_data[j][i]
-
-
-        dict = {'Time (ms)': ImagingDataset[0],
-                'Stimulus (%)': ImagingDataset[1],
-                'Trigger': ImagingDataset[2],
-                'Spikeling Fluorescence': ImagingDataset[3],
-                'Spikeling Calcium': ImagingDataset[4],
-                'Spikeling Vm (mV)': ImagingDataset[5],
-                'Neuron Aux1 Fluorescence': ImagingDataset[6],
-                'Neuron Aux1 Calcium': ImagingDataset[7],
-                'Neuron Aux1 Vm (mV)': ImagingDataset[8],
-                'Neuron Aux2 Fluorescence': ImagingDataset[9],
-                'Neuron Aux2 Calcium': ImagingDataset[10],
-                'Neuron Aux2 Vm (mV)': ImagingDataset[11]
-                }
-
-        df = pd.DataFrame(dict)
-
+        # Create a numpy array for the dataset: time, then the recorded signals
+        ImagingDataset = np.empty([12, self._rec_n], dtype=float)
+        ImagingDataset[1:] = self._rec[:, :self._rec_n]
+
+        # Time column; rounding keeps e.g. 0.3 rather than 0.30000000000000004 in the CSV
+        ImagingDataset[0] = np.round(np.arange(self._rec_n, dtype=np.float64) * SAMPLE_INTERVAL, 6)
+
+        headers = ['Time (ms)',
+                   'Stimulus (%)',
+                   'Trigger',
+                   'Spikeling Fluorescence',
+                   'Spikeling Calcium',
+                   'Spikeling Vm (mV)',
+                   'Neuron Aux1 Fluorescence',
+                   'Neuron Aux1 Calcium',
+                   'Neuron Aux1 Vm (mV)',
+                   'Neuron Aux2 Fluorescence',
+                   'Neuron Aux2 Calcium',
+                   'Neuron Aux2 Vm (mV)']
+
+        # One (N, 12) matrix written straight from numpy; %.10g keeps long time stamps exact
         recording_file_name = str(self.ui.Imaging_SelectedFolderLabel.text())
-        df.to_csv(f"{recording_file_name}.csv", index=False)
+        np.savetxt(f"{recording_file_name}.csv", ImagingDataset.T, delimiter=',',
+                   header=','.join(headers), comments='', fmt='%.10g')
 
         self.Imagingrecordflag = False
 
@@ -534,25 +602,22 @@ class ImagingGraph(QObject):
 
     def cleanup(self):
         """Release resources."""
-        if self.imagingtimer.isActive():
-            self.imagingtimer.stop()
+        if self._thread.isRunning():
+            QMetaObject.invokeMethod(self._worker, "stop", Qt.BlockingQueuedConnection)
+        if self.drawtimer.isActive():
+            self.drawtimer.stop()
 
         self.last_valid_data = None
 
-        self.imaging_data[0].clear()
-        self.imaging_data[1].clear()
-        self.imaging_data[2].clear()
-        self.imaging_data[3].clear()
-        self.imaging_data[4].clear()
-        self.imaging_data[5].clear()
-        self.imaging_data[6].clear()
-        self.imaging_data[7].clear()
-        self.imaging_data[8].clear()
-        self.imaging_data[9].clear()
-        self.imaging_data[10].clear()
-        self.imaging_data[11].clear()
+        self._rec_n = 0
 
         self.ui.Imaging_Oscilloscope_widget.clear()
         if self.secondaryVB:
             self.secondaryVB.clear()
 
+
+
+    def shutdown(self):
+        """Stop the worker thread."""
+        self._thread.quit()
+        self._thread.wait()
@@ -25,6 +25,7 @@ class SerialPortManager(QObject):
     error_occurred = Signal(str)
     connection_changed = Signal(bool)
     data_received = Signal(list)  # Signal emitted when valid data is received
+    tick = Signal()  # Signal emitted once per processed chunk of serial data, after its data_received signals
 
     _instance = None
 
@@ -214,6 +215,7 @@ class SerialPortManager(QObject):
             lines = self._buffer.split("\n")
             # Keep the last line (might be incomplete)
             self._buffer = lines[-1]
+            received = False
 
             for line in lines[:-1]:
                 line = line.strip()
@@ -230,10 +232,15 @@ class SerialPortManager(QObject):
                         floats = [float(v) for v in values]
                         # Emit as list
                         self.data_received.emit(floats)
+                        received = True
                     except ValueError:
                         # Skip bad numeric conversion
                         continue
 
+            # One tick per chunk lets listeners process its samples as a batch
+            if received:
+                self.tick.emit()
+
         except Exception as e:
             self.error_occurred.emit(f"Error processing buffered data: {str(e)}")
 
@@ -24,12 +24,10 @@ Notes on units:
   because typical kon values are expressed in (µM^-n * s^-1).
 """
 
-from PySide6.QtCore import QObject, QTimer
+from PySide6.QtCore import QCoreApplication, QObject, QTimer
 import pyqtgraph as pg
 import numpy as np
-import pandas as pd
-import collections
-from decimal import Decimal
+import math
 from typing import Tuple
 
 import Settings
@@ -50,6 +48,242 @@ STIM_MAX = 100
 
 N_NEURONS = 3                  # primary + two auxiliaries
 
+MODEL_LINEAR = 0               # fluorescence_model ids, resolved once in _select_indicator_step
+MODEL_HILL = 1
+MODEL_SIGMOID = 2
+MODEL_IDS = {"linear": MODEL_LINEAR, "hill": MODEL_HILL, "sigmoid": MODEL_SIGMOID}
+
+RX_CAPACITY = 20000            # hardware samples held between GUI ticks (~2 s at 10kHz)
+RX_WIDTH = 8                   # serial_manager columns [Vm0, Stim, Itot, Vm1, ISyn1, Vm2, ISyn2, Trigger]
+RX_REDRAW_BACKLOG = 2000       # pending rows after a tick above which redraws are spaced out
+PLOT_EVERY_MAX = 4             # redraw at least every PLOT_EVERY_MAX ticks while catching up
+PLOT_MIN_INTERVAL_MS = 33      # emulator packets are redrawn at most once per interval (~30 Hz)
+
+REC_CHUNK = 65536              # recorded samples per preallocated chunk (~6.5 s at 10kHz)
+REC_COLUMNS = [                # CSV header, one recording column each
+    "Time (ms)", "Stim", "Trigger",
+    "Vm1 (mV)", "Vm2 (mV)", "Vm3 (mV)",
+    "Ca1 (uM)", "Ca2 (uM)", "Ca3 (uM)",
+    "F1 (a.u.)", "F2 (a.u.)", "F3 (a.u.)",
+]
+
+
+# =============================================================================
+# Model kernel
+# =============================================================================
+# Plain functions of float64 arrays (one entry per neuron) and precomputed scalar
+# coefficients, so that one sample costs a handful of ufunc calls.
+
+def hill_power(x, n):
+    """
+    x**n, with the common small integer Hill coefficients / binding orders (n = 1..4)
+    unrolled into multiplications instead of the general exp(n*log(x)) power path.
+    """
+    if n == 4.0:
+        x2 = x * x
+        return x2 * x2
+    if n == 3.0:
+        return x * x * x
+    if n == 2.0:
+        return x * x
+    if n == 1.0:
+        return x
+    return x ** n
+
+
+def hill_saturation(Ca_uM, Kd_n, n):
+    """
+    Hill saturation:
+        Sat(Ca) = Ca^n / (Ca^n + Kd^n)
+
+    where:
+      - Ca is calcium concentration (µM)
+      - Kd is dissociation constant (µM), passed as Kd_n = Kd^n
+      - n  is Hill coefficient (dimensionless)
+
+    This is the equilibrium-binding approximation commonly used for GECIs.
+    Ca_uM may be a scalar or a per-neuron array.
+    """
+    Ca = np.maximum(Ca_uM, 0.0)
+    Ca_n = hill_power(Ca, n)
+    denom = Ca_n + Kd_n
+    return np.divide(Ca_n, denom, out=np.zeros_like(denom), where=denom > 0)
+
+
+def sigmoid_saturation(Ca_uM, k, c_half):
+    """
+    Sigmoid (logistic) saturation:
+        Sat(Ca) = 1 / (1 + exp(-k*(Ca - c_half)))
+    """
+    Ca = np.maximum(Ca_uM, 0.0)
+    return 1.0 / (1.0 + np.exp(-k * (Ca - c_half)))
+
+
+def two_tau_filter(y, y_inf, a_rise, a_decay):
+    """
+    Two-time-constant first-order filter, updating y in place:
+        y <- y + (1 - exp(-dt/tau))*(y_inf - y)
+    tau depends on direction (rise vs decay), chosen per element; a_rise and a_decay
+    are the precomputed (1 - exp(-dt/tau)) factors, blended on the sign of the step.
+    """
+    step = y_inf - y
+    step *= np.where(step > 0.0, a_rise, a_decay)
+    y += step
+
+
+def spike_calcium_step(vm, vm_prev, t_ms, t_last_spike_ms, ca_xd, ca_xdr, Ca,
+                       Vth, refractory_ms, exp_d, exp_dr, spikerise, Cb, ca_noise):
+    """
+    Advance spike detection and calcium of all neurons by one sample.
+
+    t_last_spike_ms, ca_xd, ca_xdr and Ca are updated in place.
+
+    1) Threshold-crossing spike detection with refractory:
+         spike = 1 if (vm_prev < Vth and vm >= Vth) and (t_ms - t_last_spike_ms >= refractory_ms)
+       This is the “spike times from Vm threshold crossings” requirement.
+
+    2) Wei-style rise/decay calcium kernel (O(1) per update).
+       Target continuous-time shape (Wei / S2F forward model concept):
+           c(t) = Σ exp(-(t-tk)/τd) * (1 - exp(-(t-tk)/τr)) + n_i(t)
+
+       Efficient identity:
+           exp(-Δ/τd) * (1 - exp(-Δ/τr))
+           = exp(-Δ/τd) - exp(-Δ*(1/τd + 1/τr))
+           = exp(-Δ/τd) - exp(-Δ/τdr),
+         where τdr = (τd*τr)/(τd+τr)
+
+       Discrete implementation (all neurons at once):
+           x_d  <- x_d  * exp(-dt/τd)  + A * spike
+           x_dr <- x_dr * exp(-dt/τdr) + A * spike
+           Ca   <- Cb + (x_d - x_dr) + noise
+
+       Units: Ca, Cb, A in µM; τ in ms; dt in ms. ca_noise is this sample's Gaussian
+       calcium noise, already scaled by sqrt(dt_s) to keep a dt-invariant magnitude.
+       Source tag: Wei-style rise/decay kernel (S2F forward model family).
+    """
+    # 1) Spike detection (threshold crossing + refractory)
+    crossed_up = (vm_prev < Vth) & (vm >= Vth)
+    spikes = crossed_up & ((t_ms - t_last_spike_ms) >= refractory_ms)
+    t_last_spike_ms[spikes] = t_ms
+    spikes = spikes.astype(float)
+
+    # 2) Calcium transient: internal kernel states, then concentration
+    ca_xd *= exp_d
+    ca_xd += spikerise * spikes
+    ca_xdr *= exp_dr
+    ca_xdr += spikerise * spikes
+    np.maximum(Cb + (ca_xd - ca_xdr) + ca_noise, 0.0, out=Ca)
+
+
+# Indicator steps: advance the indicator state (saturation / bound fraction, in [0..1]) of all
+# neurons in place. They share one signature, so the selected model is called without
+# branching; ind holds the model's own parameters. Ca is already clamped to >= 0 by
+# spike_calcium_step, so the saturation curves are evaluated inline without that clamp.
+
+def hill_indicator_step(Ca, Sat, S_bound, ind, a_rise, a_decay, dt_s):
+    """
+    Equilibrium Hill saturation, ind = (Kd^n, n):
+        Sat_inf = Ca^n / (Ca^n + Kd^n)
+    (equilibrium approximation; maps calcium to fraction bound), followed by the
+    “effective indicator kinetics” (two_tau_filter with a_rise / a_decay).
+
+    Source tag: Hill saturation used in common forward models including Vogelstein-style and S2F options.
+    """
+    Kd_n, n = ind
+    Ca_n = hill_power(Ca, n)
+    two_tau_filter(Sat, Ca_n / (Ca_n + Kd_n), a_rise, a_decay)
+    np.clip(Sat, 0.0, 1.0, out=Sat)
+
+
+def sigmoid_indicator_step(Ca, Sat, S_bound, ind, a_rise, a_decay, dt_s):
+    """
+    Sigmoid (logistic) nonlinearity, ind = (k, c_half):
+        Sat_inf = 1 / (1 + exp(-k*(Ca - c_half)))
+    followed by the two-tau indicator kinetics. Then ΔF/F is typically Sat scaled by
+    dff_max (see _sat_to_fluorescence).
+
+    Source tag: S2F-style sigmoid observation option.
+    """
+    k, c_half = ind
+    two_tau_filter(Sat, 1.0 / (1.0 + np.exp(-k * (Ca - c_half))), a_rise, a_decay)
+    np.clip(Sat, 0.0, 1.0, out=Sat)
+
+
+def kinetic_indicator_step(Ca, Sat, S_bound, ind, a_rise, a_decay, dt_s):
+    """
+    Realism toggle: kinetic binding ODE (Pham-like), ind = (S_tot, n, k_on, k_off):
+        dS_b/dt = k_on*(S_tot - S_b)*Ca^n - k_off*S_b
+        Sat = S_b / S_tot
+    Ca is held over the sample, so the ODE is linear in S_b and is advanced exactly:
+        lam    = k_on*Ca^n + k_off
+        S_inf  = k_on*S_tot*Ca^n / lam
+        S_b   <- S_inf + (S_b - S_inf)*exp(-lam*dt)
+    which is stable for any dt and stays in [0, S_tot]; dt_s is in seconds.
+
+    Source tag: Pham-style non-equilibrium binding kinetics.
+    """
+    S_tot, n, k_on, k_off = ind
+
+    on = k_on * hill_power(Ca, n)
+    lam = on + k_off
+    # lam == 0 (no binding, no unbinding): S_b stays where it is
+    S_inf = np.divide(on * S_tot, lam, out=S_bound.copy(), where=lam > 0.0)
+
+    S_bound -= S_inf
+    S_bound *= np.exp(-lam * dt_s)
+    S_bound += S_inf
+
+    np.divide(S_bound, S_tot, out=Sat)
+
+
+def frame_fluorescence(Ca_uM, Sat, z, linear, gain_eff, offset, alpha, beta, dff_max,
+                       var_floor, var_shot, pmt_noise_scale):
+    """
+    Fluorescence observation of all neurons on a camera frame.
+
+    Imaging “gain chain” (kept from your original code for didactic control):
+      gain   = Laser * PMT * FluoScale
+      offset = FluoOffset
+    gain_eff is the gain times the photobleach factor B(t): bleaching applies ONLY to the
+    optical gain term, the offset is not bleached (represents background / electronics).
+
+    Observation models:
+
+    1) Linear (Vogelstein-like) observation (linear=True):
+          F = offset + gain * [ alpha*(Ca + beta) ]
+       (This preserves the “linear” option; alpha/beta are UI-configurable if desired.)
+
+    2) Saturating observation via Sat (Hill equilibrium, sigmoid, or kinetic bound fraction):
+          ΔF/F0 = dff_max * Sat
+          F     = offset + gain * (1 + ΔF/F0)
+
+    Noise, passed as variances where they do not depend on the frame:
+      - sigma_floor: additive Gaussian floor (FluoNoiseSigma), var_floor = sigma_floor^2
+      - sigma_shot:  shot noise approx proportional to sqrt(F_mean) (PhotoShotNoise = shot_scale),
+                     so sigma_shot^2 = var_shot * F_mean with var_shot = shot_scale^2
+      - sigma_pmt:   PMT excess background noise, pmt_noise_scale * gain_eff
+                     (pmt_noise_scale = sigma0 * excess^gamma, zero while PMT <= 1.0)
+
+    The final sample is, with z one standard normal draw per neuron:
+        F = F_mean + sigma_total * z
+
+    Source tags:
+    - Linear: Vogelstein-style linear observation option.
+    - Saturating: Hill/sigmoid family used in forward models and your previous implementation.
+    """
+    # Mean fluorescence
+    if linear:
+        F_mean = offset + gain_eff * (alpha * (Ca_uM + beta))
+    else:
+        F_mean = offset + gain_eff * (1.0 + dff_max * Sat)
+    np.maximum(F_mean, 0.0, out=F_mean)
+
+    # Combine independent noises
+    sigma_pmt = pmt_noise_scale * gain_eff
+    sigma = np.sqrt(var_shot * F_mean + (var_floor + sigma_pmt * sigma_pmt))
+
+    return F_mean + sigma * z
+
 
 # =============================================================================
 # ImagingGraph
@@ -90,6 +324,7 @@ class ImagingGraph(QObject):
 
         # Frame sampling state (camera sampling)
         self._frame_phase_ms = 0.0
+        self._frame_widx = 0
         self.FrameTime_buffer = None
         self.Fluo_frame_buffers = None
 
@@ -98,9 +333,12 @@ class ImagingGraph(QObject):
 
         # Model selection flags (these may be driven by GUI later)
         # Allowed: "linear", "hill", "sigmoid"
-        self.fluorescence_model = "hill"
+        self._fluorescence_model = "hill"
         # Realism toggle: kinetic binding vs equilibrium Hill
-        self.binding_enabled = False
+        self._binding_enabled = False
+        # Model id and indicator step for the selection above (see _select_indicator_step)
+        self._model_id = MODEL_HILL
+        self._indicator_step = hill_indicator_step
 
         # Core “indicator state” variable:
         # - In equilibrium Hill/sigmoid: this is a fraction in [0..1] computed from calcium.
@@ -122,11 +360,17 @@ class ImagingGraph(QObject):
         self._ca_xd = np.zeros(N_NEURONS, dtype=float)
         self._ca_xdr = np.zeros(N_NEURONS, dtype=float)
 
+        # Memoized kernel coefficients (see _kernel_coefs); cleared whenever parameters change
+        self._coef_cache = {}
+
         # Default “effective kinetics”
         self.Ca_tau_rise_ms = 20.0        # ms (Wei kernel τrise)
         self.Ca_tau_decay_ms = 200.0      # ms (Wei kernel τdecay)
         self.spikerise = 0.010            # µM per spike event
         self.Ca_noise_uM = 0.01           # µM stddev of additive Gaussian noise
+
+        # Noise generator
+        self._rng = np.random.default_rng()
         self.Kd_uM = 0.150                 # µM dissociation constant
         self.hill_n = 4.0                 # Hill coefficient
         self.dff_max = 3.0                # max ΔF/F0 at full saturation
@@ -161,36 +405,89 @@ class ImagingGraph(QObject):
         self._plots_ready = False
         self._plot_decimator = 0
         self._plot_every = 1
+        self._drawn_state = None          # (_widx, curve visibility) of the last redraw; None forces one
         self.secondaryVB = None
         self.calciumVB = None
         self.calciumAxis = None
         self._mainVB = None               # main PlotItem viewbox reference
+        self._views_rect = None           # main viewbox scene rect last applied by update_views
 
         # Display choice
         self.use_dff = False              # ΔF/F0 plotting toggle
         self.F0 = np.ones(N_NEURONS, dtype=float)  # baseline fluorescence per neuron (for ΔF/F0 plotting)
+        self._F0_scalar = 1.0  # the same baseline as one float: all neurons share the baseline calcium
 
-        self._rx_queue = collections.deque(maxlen=20000)  # ~2 s at 10kHz
+        # Hardware RX ring buffer: rows [head, head+count) modulo RX_CAPACITY are pending
+        self._rx_buf = np.empty((RX_CAPACITY, RX_WIDTH), dtype=np.float64)
+        self._rx_head = 0
+        self._rx_count = 0
         self._rx_timer = QTimer(self)
         self._rx_timer.setInterval(16)  # ~60 Hz
         self._rx_timer.timeout.connect(self._process_rx_queue)
 
+        # Emulator redraws: packets only request one, a single-shot timer draws the newest
+        # buffers at most once per PLOT_MIN_INTERVAL_MS however fast the packets arrive
+        self._plot_timer = QTimer(self)
+        self._plot_timer.setSingleShot(True)
+        self._plot_timer.setInterval(PLOT_MIN_INTERVAL_MS)
+        self._plot_timer.timeout.connect(self._redraw_requested)
+
         # Recording
         self.record_flag = False
-        # Columns (kept simple and explicit):
+        # Columns (kept simple and explicit, see REC_COLUMNS):
         # t, stim, trig, vm1..3, ca1..3, F1..3
-        self._rec = {
-            "t_ms": [],
-            "stim": [],
-            "trig": [],
-            "vm1": [], "vm2": [], "vm3": [],
-            "ca1_uM": [], "ca2_uM": [], "ca3_uM": [],
-            "F1": [], "F2": [], "F3": [],
-        }
+        # Rows fill a preallocated chunk that is written to _rec_file whenever it is full,
+        # so memory use stays bounded however long the recording runs.
+        # Time stays float64 (absolute ms); the signal columns are float32.
+        self._rec_t = np.empty(REC_CHUNK, dtype=np.float64)
+        self._rec_buf = np.empty((REC_CHUNK, len(REC_COLUMNS) - 1), dtype=np.float32)
+        self._rec_head = 0
+        self._rec_file = None
+        self._rec_path = ""
+        # Quitting while Record is on must still flush and close the file
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_recording)
+
+        # Model parameters as plain attributes (self._p_*), refreshed whenever _imaging_params changes
+        self._refresh_param_cache()
 
         # Signals
         serial_manager.data_received.connect(self.on_data_received)
 
+    # -------------------------------------------------------------------------
+    # Model Selection
+    # -------------------------------------------------------------------------
+
+    @property
+    def fluorescence_model(self) -> str:
+        return self._fluorescence_model
+
+    @fluorescence_model.setter
+    def fluorescence_model(self, mode: str) -> None:
+        self._fluorescence_model = mode
+        self._select_indicator_step()
+
+    @property
+    def binding_enabled(self) -> bool:
+        return self._binding_enabled
+
+    @binding_enabled.setter
+    def binding_enabled(self, enabled: bool) -> None:
+        self._binding_enabled = enabled
+        self._select_indicator_step()
+
+    def _select_indicator_step(self) -> None:
+        """Resolve the model id and indicator step once per model change instead of on every sample."""
+        # Unknown names fall back to Hill, as before
+        self._model_id = MODEL_IDS.get((self._fluorescence_model or "").lower().strip(), MODEL_HILL)
+        if self._binding_enabled:
+            self._indicator_step = kinetic_indicator_step
+        elif self._model_id == MODEL_SIGMOID:
+            self._indicator_step = sigmoid_indicator_step
+        else:
+            self._indicator_step = hill_indicator_step
+
     # -------------------------------------------------------------------------
     # Source Selection
     # -------------------------------------------------------------------------
@@ -225,11 +522,11 @@ class ImagingGraph(QObject):
         self._ca_xd[:] = 0.0
         self._ca_xdr[:] = 0.0
 
-        Cb = float(self._imaging_params.get("CalciumBaseline", 0.1))  # µM
+        Cb = self._p_Cb  # µM
         self.CalciumData[:] = Cb
 
         # Initialize “indicator saturation/bound fraction” to its baseline equilibrium
-        Sat0 = self._indicator_equilibrium_saturation(Cb, self._imaging_params)
+        Sat0 = self._indicator_equilibrium_saturation(Cb)
         self.IndicatorSat[:] = Sat0
 
         # If kinetic binding is enabled, initialize bound state to equilibrium value.
@@ -238,13 +535,13 @@ class ImagingGraph(QObject):
             self._S_bound[:] = Sat0 * self._S_tot  # S_b = frac * S_tot
 
         # Initialize fluorescence to baseline with NO noise so first frame is stable.
-        F0 = self._baseline_fluorescence_from_C(Cb, self._imaging_params)
+        F0 = self._baseline_fluorescence_from_C(Cb)
         self.FluoData[:] = F0
 
         # Set F0 reference for ΔF/F plotting (same for all neurons here)
         self._update_F0_from_baseline()
 
-        self._rx_queue.clear()
+        self._rx_clear()
         self._rx_timer.start()
 
     def disconnect(self):
@@ -257,32 +554,79 @@ class ImagingGraph(QObject):
     # Data Entry Points
     # -------------------------------------------------------------------------
 
+    def _rx_clear(self) -> None:
+        self._rx_head = 0
+        self._rx_count = 0
+        self._plot_every = 1
+
     def _process_rx_queue(self):
         if self.source_mode != "spikeling" or not self.parent.ImagingConnectionFlag:
-            self._rx_queue.clear()
+            self._rx_clear()
             return
 
         max_per_tick = 5000
-        n = min(len(self._rx_queue), max_per_tick)
-
-        for _ in range(n):
-            pkt = self._rx_queue.popleft()
-            self._consume_vector(pkt, plot=False)
+        n = min(self._rx_count, max_per_tick)
+
+        # Pending rows in arrival order (a view unless the block wraps around)
+        head = self._rx_head
+        first = min(n, RX_CAPACITY - head)
+        rows = self._rx_buf[head:head + first]
+        if first < n:
+            rows = np.concatenate((rows, self._rx_buf[:n - first]))
+        self._rx_head = (head + n) % RX_CAPACITY
+        self._rx_count -= n
+
+        self._consume_batch_fast(rows)
+
+        # Redraw every tick while keeping up; while a backlog builds, redraw less often so the
+        # model can catch up, and return to every tick once the ring is drained
+        if self._rx_count > RX_REDRAW_BACKLOG:
+            self._plot_every = min(self._plot_every + 1, PLOT_EVERY_MAX)
+        elif self._rx_count == 0:
+            self._plot_every = 1
 
         if self._plots_ready:
-            self._update_plots()
-
-        if len(self._rx_queue) > max_per_tick:
-            while len(self._rx_queue) > max_per_tick:
-                self._rx_queue.popleft()
-
-    def on_data_received(self, data: list) -> None:
-        if self.source_mode != "spikeling":
+            self._plot_decimator += 1
+            if self._plot_decimator >= self._plot_every:
+                self._plot_decimator = 0
+                self._update_plots()
+
+        # Keep at most one tick of backlog: drop the oldest rows
+        if self._rx_count > max_per_tick:
+            drop = self._rx_count - max_per_tick
+            self._rx_head = (self._rx_head + drop) % RX_CAPACITY
+            self._rx_count = max_per_tick
+
+    def on_data_received(self, data) -> None:
+        """Queue an (M, 8) batch of hardware samples, one packet per row."""
+        if self.source_mode != "spikeling" or not self.parent.ImagingConnectionFlag:
             return
-        if not self.parent.ImagingConnectionFlag:
+
+        rows = np.asarray(data, dtype=np.float64)
+        if rows.ndim == 1:
+            rows = rows[np.newaxis, :]
+        if rows.ndim != 2 or rows.shape[1] != RX_WIDTH:
             return
 
-        self._rx_queue.append(data)
+        # Only the newest RX_CAPACITY rows can be held
+        m = len(rows)
+        if m > RX_CAPACITY:
+            rows = rows[-RX_CAPACITY:]
+            m = RX_CAPACITY
+
+        # Copy in at the tail, wrapping around the end of the buffer
+        tail = (self._rx_head + self._rx_count) % RX_CAPACITY
+        first = min(m, RX_CAPACITY - tail)
+        self._rx_buf[tail:tail + first] = rows[:first]
+        self._rx_buf[:m - first] = rows[first:]
+
+        # On overflow the oldest rows were overwritten
+        overflow = self._rx_count + m - RX_CAPACITY
+        if overflow > 0:
+            self._rx_head = (self._rx_head + overflow) % RX_CAPACITY
+            self._rx_count = RX_CAPACITY
+        else:
+            self._rx_count += m
 
     def on_emulator_data(self, data: list) -> None:
         """Handle incoming emulator list of packets."""
@@ -297,110 +641,154 @@ class ImagingGraph(QObject):
 
     def _consume_vector(self, data, plot=True):
         """
-        Central imaging update pipeline.
+        Single-packet entry point (emulator); the packet goes through the block pipeline
+        (_consume_batch_fast) as a one-row block.
 
         Steps:
-        1) Validate & parse incoming packet
-        2) Update calcium + fluorescence model
-        3) Append data to rolling buffers
-        4) Handle recording logic
-        5) Redraw plots (decimated)
+        1) Validate incoming packet
+        2) Update calcium + fluorescence model, rolling buffers and recording
+        3) Request a redraw (coalesced, see _request_redraw)
         """
         if not self.parent.ImagingConnectionFlag:
             return
         if data is None or len(data) < 8:
             return
 
-        parsed = self._parse_packet(data)
-        if parsed is None:
+        try:
+            row = np.asarray(data, dtype=np.float64)
+        except (TypeError, ValueError):
+            return
+        if row.ndim != 1:
             return
 
-        t_ms, vm1, stim, vm2, vm3, trig = parsed
+        self._consume_batch_fast(row[np.newaxis, :])
 
-        # dt_ms computed from timestamps if present, otherwise fixed SAMPLE_INTERVAL
-        if self._t_last_ms is None:
-            dt_ms = SAMPLE_INTERVAL
+        if plot and self._plots_ready:
+            self._request_redraw()
+
+    def _consume_batch(self, batch):
+        """Consume many packets (emulator) and request one redraw at the end."""
+        if not self.parent.ImagingConnectionFlag:
+            return
+
+        try:
+            rows = np.asarray(batch, dtype=np.float64)
+        except (TypeError, ValueError):
+            rows = None
+
+        if rows is not None and rows.ndim == 2 and rows.shape[1] >= 8:
+            self._consume_batch_fast(rows)
         else:
-            dt_ms = t_ms - self._t_last_ms
+            for pkt in batch:
+                self._consume_vector(pkt, plot=False)
 
-        # Sanity clamp dt_ms
-        if (not np.isfinite(dt_ms)) or (dt_ms <= 0.0) or (dt_ms > 1000.0):
-            dt_ms = SAMPLE_INTERVAL
+        if self._plots_ready:
+            self._request_redraw()
 
-        self._t_last_ms = t_ms
+    def _request_redraw(self) -> None:
+        """Schedule a redraw unless one is already pending (emulator entry points)."""
+        if not self._plot_timer.isActive():
+            self._plot_timer.start()
 
-        # Advance model (includes frame sampling)
-        self._update_model(vm1, stim, vm2, vm3, trig, t_ms, dt_ms)
+    def _redraw_requested(self) -> None:
+        if self._plots_ready:
+            self._update_plots()
 
-        # Append rolling buffers (including time)
-        self._append_buffers(t_ms)
+    def _consume_batch_fast(self, rows: np.ndarray) -> None:
+        """
+        Advance the pipeline over an (M, 8) or (M, 9) float64 block of packets.
 
-        # Recording state machine + capture
-        self._handle_recording()
-        if self.record_flag:
-            self._record_sample(t_ms)
+        This is the only model path (hardware ticks, emulator batches and single packets):
+          - packet fields, timestamps and dt are extracted for the whole block,
+          - dt-independent model parameters are read once (_step_params),
+          - the per-sample states are collected into (M, N_NEURONS) arrays and appended
+            to the rolling buffers and the recording in bulk.
 
-        # Plot decimation
-        if not plot or not self._plots_ready:
+        The connection flag is checked by the callers, once per tick / batch.
+        """
+        M = len(rows)
+        if M == 0 or rows.ndim != 2 or rows.shape[1] < 8:
             return
 
-        self._plot_decimator += 1
-        if self._plot_decimator >= self._plot_every:
-            self._plot_decimator = 0
-            self._update_plots()
+        # ------------------------------------------------------------
+        # Packet fields
+        # ------------------------------------------------------------
+        if rows.shape[1] >= 9:
+            # [t, Vm0, Stim, Itot, Vm1, ISyn1, Vm2, ISyn2, Trigger]
+            t = rows[:, 0].copy()
+            c = 1
+        else:
+            # no timestamp -> sequential samples at SAMPLE_INTERVAL (cumsum adds in the same order)
+            steps = np.full(M + 1, SAMPLE_INTERVAL)
+            steps[0] = getattr(self, "_t_fallback_ms", 0.0)
+            t = np.cumsum(steps)[1:]
+            self._t_fallback_ms = float(t[-1])
+            c = 0
+
+        vm = np.empty((M + 1, N_NEURONS))
+        vm[0] = self.VmData                       # previous sample
+        vm[1:] = rows[:, [c, c + 3, c + 5]]       # Vm0, Vm1, Vm2
+        stim = rows[:, c + 1]
+        trig = rows[:, c + 7]
+
+        # dt_ms from timestamps (SAMPLE_INTERVAL for the first sample, non-finite, non-positive or > 1 s steps)
+        t_prev = np.empty(M)
+        t_prev[0] = np.nan if self._t_last_ms is None else self._t_last_ms
+        t_prev[1:] = t[:-1]
+        with np.errstate(invalid="ignore"):
+            dt = t - t_prev
+            bad = ~np.isfinite(dt) | (dt <= 0.0) | (dt > 1000.0)
+        dt[bad] = SAMPLE_INTERVAL
+        self._t_last_ms = float(t[-1])
 
-    def _consume_batch(self, batch):
-        """Consume many packets (emulator) and plot once at end."""
-        if not self.parent.ImagingConnectionFlag:
+        # ------------------------------------------------------------
+        # Model, one sample at a time (the state recursions are sequential)
+        # ------------------------------------------------------------
+        if not self._imaging_params:
+            # Not configured yet: the model states are held, Vm/Stim/Trigger follow the packets
+            self.VmData[:] = vm[M]
+            self.StimData = float(stim[-1])
+            self.TriggerData = float(trig[-1])
+            vm = vm[1:]
+            ca = np.broadcast_to(self.CalciumData, (M, N_NEURONS))
+            fluo = np.broadcast_to(self.FluoData, (M, N_NEURONS))
+            self._append_block(t, stim, trig, vm, ca, fluo)
+            self._handle_recording()
+            if self.record_flag:
+                self._record_block(t, stim, trig, vm, ca, fluo)
             return
 
-        for pkt in batch:
-            self._consume_vector(pkt, plot=False)
+        params = self._step_params()
 
-        if self._plots_ready:
-            self._update_plots()
+        # Calcium noise for the whole block, scaled by sqrt(dt_s) (see _model_step)
+        ca_noise_uM = params[2]
+        if ca_noise_uM > 0:
+            ca_noise = (ca_noise_uM * np.sqrt(dt / 1000.0))[:, np.newaxis] * self._rng.standard_normal((M, N_NEURONS))
+        else:
+            ca_noise = np.zeros((M, N_NEURONS))
 
-    # -------------------------------------------------------------------------
-    # Packet Parsing
-    # -------------------------------------------------------------------------
+        ca = np.empty((M, N_NEURONS))
+        fluo = np.empty((M, N_NEURONS))
+        t_list = t.tolist()
+        dt_list = dt.tolist()
+        for m in range(M):
+            self._model_step(vm[m + 1], vm[m], t_list[m], dt_list[m], params, ca_noise[m])
+            ca[m] = self.CalciumData
+            fluo[m] = self.FluoData
 
-    def _parse_packet(self, data: list):
-        """
-        Parse packets in the two supported formats.
+        self.VmData[:] = vm[M]
+        self.StimData = float(stim[-1])
+        self.TriggerData = float(trig[-1])
 
-        Returns:
-            (t_ms, vm1, stim, vm2, vm3, trig)
-        """
-        try:
-            vals = [float(x) for x in data]
-        except Exception:
-            return None
+        # ------------------------------------------------------------
+        # Rolling buffers and recording, in bulk
+        # ------------------------------------------------------------
+        vm = vm[1:]
+        self._append_block(t, stim, trig, vm, ca, fluo)
 
-        if len(vals) >= 9:
-            # [t, Vm0, Stim, Itot, Vm1, ISyn1, Vm2, ISyn2, Trigger]
-            t = vals[0]
-            vm1 = vals[1]
-            stim = vals[2]
-            vm2 = vals[4]
-            vm3 = vals[6]
-            trig = vals[8]
-            return (t, vm1, stim, vm2, vm3, trig)
-
-        if len(vals) >= 8:
-            # no timestamp -> sequential samples at SAMPLE_INTERVAL
-            if not hasattr(self, "_t_fallback_ms"):
-                self._t_fallback_ms = 0.0
-            self._t_fallback_ms += SAMPLE_INTERVAL
-            t = self._t_fallback_ms
-
-            vm1 = vals[0]
-            stim = vals[1]
-            vm2 = vals[3]
-            vm3 = vals[5]
-            trig = vals[7]
-            return (t, vm1, stim, vm2, vm3, trig)
-
-        return None
+        self._handle_recording()
+        if self.record_flag:
+            self._record_block(t, stim, trig, vm, ca, fluo)
 
     # -------------------------------------------------------------------------
     # Imaging Model
@@ -423,19 +811,19 @@ class ImagingGraph(QObject):
         n_disp = max(10, int(n_disp_full * fraction))
 
         ys = []
-        offset = float(self._imaging_params.get("FluoOffset", 0.0)) if self.use_dff else 0.0
+        offset = self._p_fluo_offset if self.use_dff else 0.0
+        f0_sig = max(1e-12, self._F0_scalar - offset)
 
         for i, chk in enumerate(fluo_checks):
             if not chk.isChecked():
                 continue
 
             # Take last n_disp samples from the rolling buffer
-            y = np.asarray(self.Fluo_buffers[i], dtype=float)[-n_disp:]
+            y = self._unwrap(self.Fluo_buffers[i])[-n_disp:]
 
             # Apply the same ΔF/F0 transform as _update_plots()
             if self.use_dff:
                 y_sig = y - offset
-                f0_sig = max(1e-12, float(self.F0[i]) - offset)
                 y = 100.0 * (y_sig - f0_sig) / f0_sig
 
             # Ignore NaNs if any
@@ -451,7 +839,7 @@ class ImagingGraph(QObject):
         y_max = float(np.max(y_all))
 
         # Avoid zero-span ranges
-        if not np.isfinite(y_min) or not np.isfinite(y_max):
+        if not math.isfinite(y_min) or not math.isfinite(y_max):
             return
         if (y_max - y_min) < 1e-9:
             y_min -= 1.0
@@ -498,6 +886,7 @@ class ImagingGraph(QObject):
         p["dff_max"] = self.dff_max
         p["Ind_tau_rise_ms"] = self.Ind_tau_rise_ms
         p["Ind_tau_decay_ms"] = self.Ind_tau_decay_ms
+        self._refresh_param_cache()
 
         # UI update (kept from original; safe-clamped)
         if update_ui:
@@ -566,414 +955,235 @@ class ImagingGraph(QObject):
         p["dff_max"] = tau_rise
         p["Ind_tau_rise_ms"] = tau_decay
         p["Ind_tau_decay_ms"] = dff_max
+        self._refresh_param_cache()
 
-    def _update_photobleach(self, dt_ms: float, p: dict) -> None:
-        dt_s = max(0.0, float(dt_ms)) / 1000.0
-        if dt_s <= 0:
-            return
-
-        L = float(p.get("Laser", 1.0))
-
-        k_bleach = float(p.get("Bleach_k", getattr(self, "bleach_k", 0.20)))
-        k_recover = float(p.get("Recover_k", getattr(self, "recover_k", 0.05)))
-
-        over = max(0.0, L - 1.0)
-        under = max(0.0, 1.0 - L)
-
-        # Bleach only when Laser > 100%
-        if over > 0.0 and k_bleach > 0.0:
-            self.bleach_B *= float(np.exp(-k_bleach * over * dt_s))
-
-        # Recover only when Laser < 100%
-        if under > 0.0 and k_recover > 0.0:
-            self.bleach_B += (1.0 - self.bleach_B) * float(1.0 - np.exp(-k_recover * under * dt_s))
-
-        # Clamp
-        self.bleach_B = float(np.clip(self.bleach_B, self.bleach_B_min, 1.0))
+    def _step_params(self) -> tuple:
+        """
+        dt-independent model parameters, read once per sample or once per block:
+            (spikerise, Cb, Ca_noise_uM, indicator_step, indicator_params)
+        """
+        # Spike amplitude per event (µM) and internal calcium noise (µM * sqrt(s))
+        self.spikerise = self._p_spikerise
+        self.Ca_noise_uM = self._p_ca_noise
+
+        # Indicator model and its parameters
+        step = self._indicator_step
+        if step is kinetic_indicator_step:
+            # Kinetic binding (rates per second, so dt in seconds)
+            ind = (self._p_S_tot, self._p_bind_n, self._p_k_on, self._p_k_off)
+        elif step is sigmoid_indicator_step:
+            # Sigmoid: k in 1/µM, c_half in µM
+            ind = (self._p_sig_k, self._p_sig_c_half)
+        else:
+            # Hill: Kd^n in µM^n, n
+            ind = (self._p_Kd_n, self._p_hill_n)
 
+        return (self.spikerise, self._p_Cb, self.Ca_noise_uM, step, ind)
 
-    def _update_model(self, vm1, stim, vm2, vm3, trigger, t_ms, dt_ms):
+    def _model_step(self, vm: np.ndarray, vm_prev: np.ndarray, t_ms: float, dt_ms: float,
+                    params: tuple, ca_noise) -> None:
         """
-        Update calcium and fluorescence model for all neurons.
+        Advance photobleaching, frame timing, the model kernel and the frame observation by one
+        sample (dt_ms already validated); params comes from _step_params and ca_noise is this
+        sample's calcium noise (µM, per neuron, or 0.0).
 
           - Calcium is updated at every incoming sample (dt_ms)
           - Fluorescence is only *observed* on camera frames (frame_rate) and held constant between frames.
 
-        Model steps per neuron i:
-          1) spike_i  = detect_spike(Vm_i, Vm_prev_i, t_ms)
-          2) Ca_i     = update_calcium(i, spike_i, dt_ms)
-          3) Sat_i    = update_indicator_sat(i, Ca_i, dt_ms) equilibrium Hill/sigmoid or kinetic ODE
-          4) If new frame: F_i = sat_to_fluorescence(Ca_i, Sat_i, ...)
+        Model steps, each evaluated on the length-N_NEURONS state arrays at once:
+          1-2) spike_calcium_step: spikes from Vm threshold crossings, calcium kernel
+          3)   indicator step selected by the model (equilibrium Hill/sigmoid or kinetic ODE)
+          4)   If new frame: F = sat_to_fluorescence(Ca, Sat, ...)
         """
-        self.VmData[:] = (vm1, vm2, vm3)
-        self.StimData = stim
-        self.TriggerData = trigger
+        spikerise, Cb, _, indicator_step, ind = params
 
-        if not self._imaging_params:
-            return
-        p = self._imaging_params
+        # Calcium decay factors, indicator two-tau factors and photobleach factors for this dt
+        exp_d, exp_dr, a_rise, a_decay, bleach_f, recover_g = self._kernel_coefs(dt_ms)
 
-        self._update_photobleach(dt_ms, p)
+        # Photobleaching: bleach when Laser > 100%, recover when Laser < 100%, then clamp
+        B = self.bleach_B * bleach_f
+        B += (1.0 - B) * recover_g
+        # Plain comparisons rather than min()/max() calls: this runs for every sample
+        if B > 1.0:
+            B = 1.0
+        elif B < self.bleach_B_min:
+            B = self.bleach_B_min
+        self.bleach_B = B
 
         # ------------------------------------------------------------
         # Frame timing: frame_rate [Hz] -> period [ms]
         # ------------------------------------------------------------
-        frame_period_ms = 1000.0 / max(1.0, float(p.get("frame_rate", 10)))
-        self._frame_phase_ms += float(dt_ms)
+        frame_period_ms = self._p_frame_period_ms
+        self._frame_phase_ms += dt_ms
 
         new_frame = (self._frame_phase_ms >= frame_period_ms)
         if new_frame:
             n_frames = int(self._frame_phase_ms // frame_period_ms)
             self._frame_phase_ms -= n_frames * frame_period_ms
 
-        # Will hold fluorescence computed at this frame (only valid if new_frame=True)
-        frame_fluo = [None] * N_NEURONS
-
-        for i in range(N_NEURONS):
-            # Vm_prev from buffer (last appended sample) if available; else use current
-            vm_prev = self.Vm_buffers[i][-1] if hasattr(self, "Vm_buffers") and len(self.Vm_buffers[i]) else self.VmData[i]
+        dt_s = dt_ms / 1000.0
+        if dt_s < 1e-9:
+            dt_s = 1e-9
 
-            # 1) Spike detection (threshold crossing + refractory)
-            spike = self._detect_spike(vm_now=self.VmData[i], vm_prev=vm_prev, t_ms=t_ms, neuron_index=i)
+        # 1-2) Spike detection and calcium transient
+        spike_calcium_step(vm, vm_prev, t_ms, self._t_last_spike_ms, self._ca_xd, self._ca_xdr, self.CalciumData,
+                           self.SpikeThreshold, self.SpikeRefractory_ms, exp_d, exp_dr, spikerise, Cb, ca_noise)
 
-            # 2) Calcium transient (Wei rise/decay kernel; separate τrise and τdecay)
-            self.CalciumData[i] = self._update_calcium(neuron_index=i, spike=spike, p=p, dt_ms=dt_ms)
+        # 3) Indicator saturation / bound fraction (selected model)
+        indicator_step(self.CalciumData, self.IndicatorSat, self._S_bound, ind, a_rise, a_decay, dt_s)
 
-            # 3) Indicator saturation / bound fraction (equilibrium Hill or sigmoid, OR kinetic binding ODE)
-            self.IndicatorSat[i] = self._update_indicator_sat(
-                neuron_index=i,
-                Ca_uM=self.CalciumData[i],
-                p=p,
-                dt_ms=dt_ms
-            )
-
-            # 4) Fluorescence observation (sampled at frame times)
-            if new_frame:
-                frame_fluo[i] = self._sat_to_fluorescence(
-                    neuron_index=i,
-                    Ca_uM=self.CalciumData[i],
-                    Sat=self.IndicatorSat[i],
-                    p=p
-                )
-
-        # Commit a new camera sample
+        # 4) Fluorescence observation (sampled at frame times) and commit of a new camera sample
         if new_frame:
+            frame_fluo = self._sat_to_fluorescence(Ca_uM=self.CalciumData, Sat=self.IndicatorSat)
+
             # Frame time is the boundary time (approx): current time minus remaining phase
-            t_frame_ms = float(t_ms) - float(self._frame_phase_ms)
-            self.FrameTime_buffer.append(t_frame_ms)
-            for i in range(N_NEURONS):
-                self.FluoData[i] = float(frame_fluo[i])
-                self.Fluo_frame_buffers[i].append(float(frame_fluo[i]))
+            j = self._frame_widx % self._frame_bufsize
+            self.FrameTime_buffer[j] = t_ms - self._frame_phase_ms
+            self.Fluo_frame_buffers[:, j] = frame_fluo
+            self._frame_widx += 1
+            self.FluoData[:] = frame_fluo
         # Else: FluoData is held between frames by design (camera sampling effect).
 
-    def _detect_spike(self, vm_now: float, vm_prev: float, t_ms: float, neuron_index: int) -> int:
+    def _kernel_coefs(self, dt_ms: float) -> Tuple[float, float, float, float, float, float]:
         """
-        Threshold-crossing spike detection with refractory.
-
-        Rule:
-          spike = 1 if (vm_prev < Vth and vm_now >= Vth) and (t_ms - t_last_spike_ms >= refractory_ms)
-
-        This is the “spike times from Vm threshold crossings” requirement.
-        """
-        crossed_up = (vm_prev < self.SpikeThreshold) and (vm_now >= self.SpikeThreshold)
-        if not crossed_up:
-            return 0
-
-        # Refractory check (prevents double detection within the same spike waveform)
-        if (t_ms - self._t_last_spike_ms[neuron_index]) < self.SpikeRefractory_ms:
-            return 0
-
-        self._t_last_spike_ms[neuron_index] = float(t_ms)
-        return 1
-
-    def _update_calcium(self, neuron_index: int, spike: int, p: dict, dt_ms: float) -> float:
+        dt-dependent model coefficients (exp_d, exp_dr, a_rise, a_decay, bleach_f, recover_g):
+          - exp_d  = exp(-dt/τd), exp_dr = exp(-dt/τdr) for the Wei calcium kernel
+          - a_rise = 1 - exp(-dt/τrise_ind), a_decay = 1 - exp(-dt/τdecay_ind) for the indicator filter
+          - bleach_f = exp(-k_bleach*(L-1)*dt_s) while Laser L > 100% (else 1),
+            recover_g = 1 - exp(-k_recover*(1-L)*dt_s) while L < 100% (else 0), rates in 1/s
+
+        The time constants only change with the parameters and dt is nearly constant, so the
+        tuple is memoized per dt until _refresh_param_cache is called.
         """
-        Wei-style rise/decay calcium kernel (O(1) per update).
-
-        Target continuous-time shape (Wei / S2F forward model concept):
-            c(t) = Σ exp(-(t-tk)/τd) * (1 - exp(-(t-tk)/τr)) + n_i(t)
-
-        Efficient identity:
-            exp(-Δ/τd) * (1 - exp(-Δ/τr))
-            = exp(-Δ/τd) - exp(-Δ*(1/τd + 1/τr))
-            = exp(-Δ/τd) - exp(-Δ/τdr),
-          where τdr = (τd*τr)/(τd+τr)
+        coefs = self._coef_cache.get(dt_ms)
+        if coefs is not None:
+            return coefs
 
-        Discrete implementation (per neuron):
-            x_d  <- x_d  * exp(-dt/τd)  + A * spike
-            x_dr <- x_dr * exp(-dt/τdr) + A * spike
-            Ca   <- Cb + (x_d - x_dr) + noise
-
-        Notes:
-        - Units: Ca, Cb, A in µM; τ in ms; dt in ms.
-        - noise is optional internal Gaussian; we scale by sqrt(dt_s) to keep dt-invariant magnitude.
-
-        Source tag: Wei-style rise/decay kernel (S2F forward model family).
-        """
-        dt_ms = float(dt_ms)
-        if (not np.isfinite(dt_ms)) or (dt_ms <= 0.0):
-            dt_ms = SAMPLE_INTERVAL
-
-        # Read effective kernel parameters (ms)
-        tau_r = float(p.get("Ca_tau_rise_ms", self.Ca_tau_rise_ms))
-        tau_d = float(p.get("Ca_tau_decay_ms", self.Ca_tau_decay_ms))
-
-        # Clamp to avoid division by zero
-        tau_r = max(1e-6, tau_r)
-        tau_d = max(1e-6, tau_d)
+        # Calcium kernel time constants (ms), clamped to avoid division by zero
+        tau_r = self._p_ca_tau_rise
+        tau_d = self._p_ca_tau_decay
 
         # τdr = (τd*τr)/(τd+τr)
         tau_dr = (tau_d * tau_r) / (tau_d + tau_r)
 
-        # Exponential decay factors
-        exp_d = np.exp(-dt_ms / tau_d)
-        exp_dr = np.exp(-dt_ms / tau_dr)
-
-        # Spike amplitude per event (µM)
-        self.spikerise = float(p.get("SpikeRise", 0.1))  # slider value already scaled in _connect_parameters
-
-        # Baseline calcium (µM)
-        Cb = float(p.get("CalciumBaseline", 0.1))
-
-        i = neuron_index
+        # Effective indicator kinetics (ms)
+        tau_r_ind = self._p_ind_tau_rise
+        tau_d_ind = self._p_ind_tau_decay
 
-        # Update internal kernel states
-        self._ca_xd[i] = self._ca_xd[i] * exp_d + self.spikerise * float(spike)
-        self._ca_xdr[i] = self._ca_xdr[i] * exp_dr + self.spikerise * float(spike)
-
-        # Construct calcium concentration
-        C = Cb + (self._ca_xd[i] - self._ca_xdr[i])
-
-        # Internal calcium noise (Gaussian)
-        # We reuse existing slider "NoiseScale" semantics, scaled by sqrt(dt_s).
-        self.Ca_noise_uM = float(p.get("NoiseScale", 0.0))
-        if self.Ca_noise_uM > 0:
-            dt_s = dt_ms / 1000.0
-            C += self.Ca_noise_uM * np.sqrt(dt_s) * np.random.normal()
-
-        return max(float(C), 0.0)
-
-
-    def _two_tau_filter(self, y_prev: float, y_inf: float, dt_ms: float, tau_rise_ms: float,
-                        tau_decay_ms: float) -> float:
-        """
-        Two-time-constant first-order filter:
-            y <- y + (1 - exp(-dt/tau))*(y_inf - y)
-        tau depends on direction (rise vs decay).
-        """
-        tau = float(tau_rise_ms) if (y_inf > y_prev) else float(tau_decay_ms)
-        tau = max(1e-6, tau)
-        a = 1.0 - np.exp(-float(dt_ms) / tau)
-        return float(y_prev + a * (y_inf - y_prev))
+        # Photobleaching
+        L = self._p_laser
+        k_bleach = self._p_bleach_k
+        k_recover = self._p_recover_k
+        over = max(0.0, L - 1.0)
+        under = max(0.0, 1.0 - L)
+        dt_s = dt_ms / 1000.0
 
+        bleach_f = 1.0
+        if over > 0.0 and k_bleach > 0.0:
+            bleach_f = math.exp(-k_bleach * over * dt_s)
 
-    def _update_indicator_sat(self, neuron_index: int, Ca_uM: float, p: dict, dt_ms: float) -> float:
-        """
-        Update the indicator state (saturation / bound fraction) in [0..1].
-
-        Modes:
-          A) Equilibrium Hill saturation (default):
-               Sat = Ca^n / (Ca^n + Kd^n)
-             (equilibrium approximation; maps calcium to fraction bound)
-             Source tag: Hill saturation used in common forward models including Vogelstein-style and S2F options.
-
-          B) Optional sigmoid (logistic) nonlinearity:
-               Sat = 1 / (1 + exp(-k*(Ca - c_half)))
-             Then ΔF/F is typically Sat scaled by dff_max (see _sat_to_fluorescence).
-             Source tag: S2F-style sigmoid observation option.
-
-          C) Realism toggle: kinetic binding ODE (Pham-like):
-               dS_b/dt = k_on*(S_tot - S_b)*Ca^n - k_off*S_b
-               Sat = S_b / S_tot
-             We integrate with Euler per dt (sufficient for small dt in GUI).
-             Source tag: Pham-style non-equilibrium binding kinetics.
-
-        Important: dt_ms is milliseconds; kinetic ODE uses seconds.
+        recover_g = 0.0
+        if under > 0.0 and k_recover > 0.0:
+            recover_g = 1.0 - math.exp(-k_recover * under * dt_s)
+
+        coefs = (math.exp(-dt_ms / tau_d),
+                 math.exp(-dt_ms / tau_dr),
+                 1.0 - math.exp(-dt_ms / tau_r_ind),
+                 1.0 - math.exp(-dt_ms / tau_d_ind),
+                 bleach_f,
+                 recover_g)
+
+        # Timestamped sources jitter dt slightly; keep the table small
+        if len(self._coef_cache) >= 64:
+            self._coef_cache.clear()
+        self._coef_cache[dt_ms] = coefs
+        return coefs
+
+    def _refresh_param_cache(self) -> None:
         """
-        i = neuron_index
-        Ca = max(0.0, float(Ca_uM))
-
-        # ---- Kinetic binding toggle (non-equilibrium) ----
-        if self.binding_enabled:
-            # Convert dt to seconds for rate equation
-            dt_s = max(1e-9, float(dt_ms) / 1000.0)
-
-            # Pull kinetics parameters (can later be driven by GUI)
-            S_tot = float(p.get("Bind_S_tot", self._S_tot))
-            n = float(p.get("Bind_n", self._bind_n))
-            k_on = float(p.get("Bind_k_on", self._k_on))
-            k_off = float(p.get("Bind_k_off", self._k_off))
-
-            S_tot = max(1e-12, S_tot)
-            n = max(1e-12, n)
-
-            # ODE terms:
-            # forward = k_on * (S_tot - S_b) * Ca^n
-            # backward = k_off * S_b
-            forward = k_on * (S_tot - self._S_bound[i]) * (Ca ** n)
-            backward = k_off * self._S_bound[i]
-
-            # Euler update
-            self._S_bound[i] += dt_s * (forward - backward)
-
-            # Clamp to physical range
-            self._S_bound[i] = min(max(self._S_bound[i], 0.0), S_tot)
-
-            # Return bound fraction
-            return float(self._S_bound[i] / S_tot)
-
-        # ---- Equilibrium mapping (Hill or sigmoid) ----
-        model = (self.fluorescence_model or "").lower().strip()
-
-        if model == "sigmoid":
-            k = float(p.get("Sig_k", self.sig_k))
-            c_half = float(p.get("Sig_c_half_uM", self.sig_c_half_uM))
-            Sat_inf = float(1.0 / (1.0 + np.exp(-k * (Ca - c_half))))
-        else:
-            Sat_inf = float(self._hill_saturation(Ca, p))
-
-        # NEW: apply “effective indicator kinetics” (unless kinetic binding ODE is enabled)
-        Sat_prev = float(self.IndicatorSat[i])
-        tau_r = float(p.get("Ind_tau_rise_ms", getattr(self, "Ind_tau_rise_ms", 50.0)))
-        tau_d = float(p.get("Ind_tau_decay_ms", getattr(self, "Ind_tau_decay_ms", 300.0)))
-
-        Sat = self._two_tau_filter(Sat_prev, Sat_inf, dt_ms=float(dt_ms), tau_rise_ms=tau_r, tau_decay_ms=tau_d)
-
-        # Clamp to [0..1]
-        return float(min(max(Sat, 0.0), 1.0))
-
-    def _hill_saturation(self, Ca_uM: float, p: dict) -> float:
+        Copy the model parameters out of _imaging_params into float attributes (self._p_*) for
+        the per-sample and per-frame code, with the same defaults and clamps as before, and drop
+        the memoized kernel coefficients. Call after every change to _imaging_params.
         """
-        Hill saturation:
-            Sat(Ca) = Ca^n / (Ca^n + Kd^n)
-
-        where:
-          - Ca is calcium concentration (µM)
-          - Kd is dissociation constant (µM)
-          - n  is Hill coefficient (dimensionless)
+        p = self._imaging_params
 
-        This is the equilibrium-binding approximation commonly used for GECIs.
-        """
-        n = float(p.get("HillCoef", self.hill_n))
-        Kd = float(p.get("DissociationConstant", self.Kd_uM))
-        n = max(1e-12, n)
-        Kd = max(1e-12, Kd)
-
-        Ca = max(0.0, float(Ca_uM))
-        Ca_n = Ca ** n
-        Kd_n = Kd ** n
-        denom = Ca_n + Kd_n
-        return (Ca_n / denom) if denom > 0 else 0.0
-
-    def _sat_to_fluorescence(self, neuron_index: int, Ca_uM: float, Sat: float, p: dict) -> float:
+        # Camera and gain chain
+        self._p_frame_period_ms = 1000.0 / max(1.0, float(p.get("frame_rate", 10)))
+        self._p_laser = float(p.get("Laser", 1.0))
+        self._p_pmt = float(p.get("PMT", 1.0))
+        self._p_fluo_scale = float(p.get("FluoScale", 1.0))
+        self._p_fluo_offset = float(p.get("FluoOffset", 0.0))
+
+        # Calcium (µM, ms)
+        self._p_Cb = float(p.get("CalciumBaseline", 0.1))
+        self._p_spikerise = float(p.get("SpikeRise", 0.1))  # slider value already scaled in _connect_parameters
+        self._p_ca_noise = float(p.get("NoiseScale", 0.0))
+        self._p_ca_tau_rise = max(1e-6, float(p.get("Ca_tau_rise_ms", self.Ca_tau_rise_ms)))
+        self._p_ca_tau_decay = max(1e-6, float(p.get("Ca_tau_decay_ms", self.Ca_tau_decay_ms)))
+
+        # Indicator
+        self._p_ind_tau_rise = max(1e-6, float(p.get("Ind_tau_rise_ms", getattr(self, "Ind_tau_rise_ms", 50.0))))
+        self._p_ind_tau_decay = max(1e-6, float(p.get("Ind_tau_decay_ms", getattr(self, "Ind_tau_decay_ms", 300.0))))
+        self._p_hill_n = max(1e-12, float(p.get("HillCoef", self.hill_n)))
+        self._p_Kd_n = max(1e-12, float(p.get("DissociationConstant", self.Kd_uM))) ** self._p_hill_n
+        self._p_sig_k = float(p.get("Sig_k", self.sig_k))
+        self._p_sig_c_half = float(p.get("Sig_c_half_uM", self.sig_c_half_uM))
+        self._p_dff_max = float(p.get("dff_max", self.dff_max))
+        self._p_lin_alpha = float(p.get("Lin_alpha", 1.0))
+        self._p_lin_beta = float(p.get("Lin_beta", 0.0))
+
+        # Kinetic binding
+        self._p_S_tot = max(1e-12, float(p.get("Bind_S_tot", self._S_tot)))
+        self._p_bind_n = max(1e-12, float(p.get("Bind_n", self._bind_n)))
+        self._p_k_on = float(p.get("Bind_k_on", self._k_on))
+        self._p_k_off = float(p.get("Bind_k_off", self._k_off))
+
+        # Photobleaching (1/s)
+        self._p_bleach_k = float(p.get("Bleach_k", getattr(self, "bleach_k", 0.20)))
+        self._p_recover_k = float(p.get("Recover_k", getattr(self, "recover_k", 0.05)))
+
+        # Noise
+        self._p_fluo_noise_sigma = float(p.get("FluoNoiseSigma", 0.0))
+        self._p_shot_noise = float(p.get("PhotoShotNoise", 0.0))
+        self._p_pmt_noise_sigma = float(p.get("PMT_excess_noise_sigma", getattr(self, "pmt_excess_noise_sigma", 0.02)))
+        self._p_pmt_noise_gamma = float(p.get("PMT_excess_noise_gamma", getattr(self, "pmt_excess_noise_gamma", 2.0)))
+
+        # Frame-path constants: gain = Laser * PMT * FluoScale, noise variances, PMT excess-noise scale sigma0 * excess^gamma
+        self._p_gain = self._p_laser * self._p_pmt * self._p_fluo_scale
+        self._p_fluo_noise_var = self._p_fluo_noise_sigma ** 2
+        self._p_shot_noise_var = self._p_shot_noise ** 2
+        self._p_pmt_noise_scale = self._p_pmt_noise_sigma * (max(0.0, self._p_pmt - 1.0) ** self._p_pmt_noise_gamma)
+
+        self._coef_cache.clear()
+        self._drawn_state = None
+
+    def _sat_to_fluorescence(self, Ca_uM: np.ndarray, Sat: np.ndarray) -> np.ndarray:
         """
-        Convert the current model state into a fluorescence observation on a camera frame.
-
-        Imaging “gain chain” (kept from your original code for didactic control):
-          gain   = Laser * PMT * FluoScale
-          offset = FluoOffset
-
-        Observation models:
-
-        1) Linear (Vogelstein-like) observation:
-              F = offset + gain * [ alpha*(Ca + beta) ]
-           (This preserves the “linear” option; alpha/beta are UI-configurable if desired.)
-
-        2) Saturating observation via Sat (Hill equilibrium, sigmoid, or kinetic bound fraction):
-              ΔF/F0 = dff_max * Sat
-              F     = offset + gain * (1 + ΔF/F0)
-
-        Noise:
-          - sigma_floor: additive Gaussian floor (FluoNoiseSigma)
-          - sigma_shot:  shot noise approx proportional to sqrt(F_mean) (PhotoShotNoise)
-
-        The final sample is:
-            F = F_mean + N(0, sigma_total)
-
-        Source tags:
-        - Linear: Vogelstein-style linear observation option.
-        - Saturating: Hill/sigmoid family used in forward models and your previous implementation.
-
-        Photobleach:
-        - Apply a multiplicative bleaching factor B(t) ONLY to the optical gain term.
-        - Offset is not bleached (represents background / electronics).
+        Convert the current model state into fluorescence observations on a camera frame,
+        one per neuron (see frame_fluorescence); parameters come from the self._p_* cache
+        (see _refresh_param_cache) and the bleach factor B(t) scales the optical gain.
         """
-        # -------------------------
-        # Gains
-        # -------------------------
-        laser = float(p.get("Laser", 1.0))
-        pmt = float(p.get("PMT", 1.0))
-        fs = float(p.get("FluoScale", 1.0))
-        offset = float(p.get("FluoOffset", 0.0))
-
-        gain = laser * pmt * fs
-
-        # Photobleach factor
-        B = float(getattr(self, "bleach_B", 1.0))
-        gain_eff = gain * B
-
-        model = (self.fluorescence_model or "").lower().strip()
-
-        # -------------------------
-        # Mean fluorescence
-        # -------------------------
-        if model == "linear":
-            # F = offset + gain * [ alpha*(Ca + beta) ]
-            alpha = float(p.get("Lin_alpha", 1.0))
-            beta = float(p.get("Lin_beta", 0.0))
-            F_mean = offset + gain_eff * (alpha * (float(Ca_uM) + beta))
-            F_mean = max(0.0, F_mean)
-
-        else:
-            # ΔF/F0 = dff_max * Sat ; F = offset + gain * (1 + ΔF/F0)
-            dff_max = float(p.get("dff_max", self.dff_max))
-            dff = dff_max * float(Sat)
-            F_mean = offset + gain_eff * (1.0 + dff)
-            F_mean = max(0.0, F_mean)
-
-
-        # -------------------------
-        # Noise terms
-        # -------------------------
-        # Noise model (frame-sampled)
-        sigma_floor = float(p.get("FluoNoiseSigma", 0.0))
-
-        # Simple shot noise proxy (kept compatible with your previous slider meaning)
-        shot_scale = float(p.get("PhotoShotNoise", 0.0))
-        sigma_shot = shot_scale * np.sqrt(max(F_mean, 0.0))
-
-        # NEW: PMT excess background noise (only when PMT > 1.0)
-        excess = max(0.0, pmt - 1.0)
-        sigma0 = float(p.get("PMT_excess_noise_sigma", getattr(self, "pmt_excess_noise_sigma", 0.02)))
-        gamma = float(p.get("PMT_excess_noise_gamma", getattr(self, "pmt_excess_noise_gamma", 2.0)))
-
-        # Additive “background” term that grows superlinearly with excess gain
-        sigma_pmt = sigma0 * (excess ** gamma) * gain_eff
-
-        # Combine independent noises
-        sigma = np.sqrt(sigma_floor ** 2 + sigma_shot ** 2 + sigma_pmt**2)
-
-        return float(F_mean + sigma * np.random.normal())
+        return frame_fluorescence(Ca_uM, Sat, self._rng.standard_normal(N_NEURONS), self._model_id == MODEL_LINEAR,
+                                  self._p_gain * self.bleach_B, self._p_fluo_offset,
+                                  self._p_lin_alpha, self._p_lin_beta, self._p_dff_max,
+                                  self._p_fluo_noise_var, self._p_shot_noise_var, self._p_pmt_noise_scale)
 
     # -------------------------------------------------------------------------
     # Baselines / ΔF/F0
     # -------------------------------------------------------------------------
 
-    def _indicator_equilibrium_saturation(self, Ca_uM: float, p: dict) -> float:
+    def _indicator_equilibrium_saturation(self, Ca_uM: float) -> float:
         """
         Compute baseline saturation under the current NON-kinetic equilibrium mapping
         (used for initialization and baseline reference).
 
         If kinetic mode is enabled, we still use equilibrium here to initialize the ODE state.
         """
-        if (self.fluorescence_model or "").lower().strip() == "sigmoid":
-            k = float(p.get("Sig_k", self.sig_k))
-            c_half = float(p.get("Sig_c_half_uM", self.sig_c_half_uM))
-            Ca = max(0.0, float(Ca_uM))
-            return float(1.0 / (1.0 + np.exp(-k * (Ca - c_half))))
-        return float(self._hill_saturation(Ca_uM, p))
-
-    def _baseline_fluorescence_from_C(self, Ca_uM: float, p: dict) -> float:
+        if self._model_id == MODEL_SIGMOID:
+            return float(sigmoid_saturation(float(Ca_uM), self._p_sig_k, self._p_sig_c_half))
+        return float(hill_saturation(Ca_uM, self._p_Kd_n, self._p_hill_n))
+
+    def _baseline_fluorescence_from_C(self, Ca_uM: float) -> float:
         """
         Compute expected baseline fluorescence (NO noise) at calcium=Ca_uM.
 
@@ -981,18 +1191,14 @@ class ImagingGraph(QObject):
           - at connect() to initialize FluoData cleanly
           - by _update_F0_from_baseline() as reference for ΔF/F0 plotting
         """
-        gain = float(p.get("Laser", 1.0)) * float(p.get("PMT", 1.0)) * float(p.get("FluoScale", 1.0))
-        offset = float(p.get("FluoOffset", 0.0))
-        model = (self.fluorescence_model or "").lower().strip()
-
-        if model == "linear":
-            alpha = float(p.get("Lin_alpha", 1.0))
-            beta = float(p.get("Lin_beta", 0.0))
-            return float(offset + gain * (alpha * (float(Ca_uM) + beta)))
-
-        Sat0 = self._indicator_equilibrium_saturation(Ca_uM, p)
-        dff_max = float(p.get("dff_max", self.dff_max))
-        dff0 = dff_max * Sat0
+        gain = self._p_gain
+        offset = self._p_fluo_offset
+
+        if self._model_id == MODEL_LINEAR:
+            return float(offset + gain * (self._p_lin_alpha * (float(Ca_uM) + self._p_lin_beta)))
+
+        Sat0 = self._indicator_equilibrium_saturation(Ca_uM)
+        dff0 = self._p_dff_max * Sat0
         return float(offset + gain * (1.0 + dff0))
 
     def _update_F0_from_baseline(self) -> None:
@@ -1006,12 +1212,12 @@ class ImagingGraph(QObject):
         """
         if not self._imaging_params:
             return
-        p = self._imaging_params
 
-        Cb = float(p.get("CalciumBaseline", 0.1))
-        F0 = self._baseline_fluorescence_from_C(Cb, p)
+        F0 = self._baseline_fluorescence_from_C(self._p_Cb)
 
-        self.F0[:] = float(F0)
+        self._F0_scalar = float(F0)
+        self.F0[:] = self._F0_scalar
+        self._drawn_state = None
 
     def ActivateDf(self, checked=None) -> None:
         """
@@ -1039,6 +1245,7 @@ class ImagingGraph(QObject):
             ax_left.setLabel("Fluorescence", units="a.u.")
 
         # Force redraw
+        self._drawn_state = None
         if self._plots_ready:
             self._update_plots()
 
@@ -1050,45 +1257,79 @@ class ImagingGraph(QObject):
         """Create rolling buffers for all plotted variables."""
         self._bufsize = int(TIME_WINDOW / SAMPLE_INTERVAL)
 
-        self.Time_buffer = collections.deque([0.0] * self._bufsize, self._bufsize)
         self.Imagingx = (np.arange(self._bufsize) - (self._bufsize - 1)) * SAMPLE_INTERVAL
 
-        self.Stim_buffer = collections.deque([0.0] * self._bufsize, self._bufsize)
-        self.Trigger_buffer = collections.deque([0.0] * self._bufsize, self._bufsize)
+        # Ring buffers: sample k is stored at column k % _bufsize, _widx counts samples written.
+        # Displayed signals are float32, time stays float64 (absolute ms timestamps).
+        self._widx = 0
+        self._drawn_state = None
+        self.Time_buffer = np.zeros(self._bufsize, dtype=np.float64)
+        self.Stim_buffer = np.zeros(self._bufsize, dtype=np.float32)
+        self.Trigger_buffer = np.zeros(self._bufsize, dtype=np.float32)
 
-        self.Calcium_buffers = [
-            collections.deque([0.0] * self._bufsize, self._bufsize)
-            for _ in range(N_NEURONS)
-        ]
-        self.Fluo_buffers = [
-            collections.deque([0.0] * self._bufsize, self._bufsize)
-            for _ in range(N_NEURONS)
-        ]
-        self.Vm_buffers = [
-            collections.deque([0.0] * self._bufsize, self._bufsize)
-            for _ in range(N_NEURONS)
-        ]
+        # One row per neuron
+        self.Calcium_buffers = np.zeros((N_NEURONS, self._bufsize), dtype=np.float32)
+        self.Fluo_buffers = np.zeros((N_NEURONS, self._bufsize), dtype=np.float32)
+        self.Vm_buffers = np.zeros((N_NEURONS, self._bufsize), dtype=np.float32)
 
-        # Frame-sampled buffers
+        # Frame-sampled ring buffers (same scheme, frame k at column k % _frame_bufsize)
         max_fps = max(1, self.ui.Imaging_FrameRate_Slider.maximum()*100)
         self._frame_bufsize = int(TIME_WINDOW * max_fps / 1000.0) + 10
-        self.FrameTime_buffer = collections.deque(maxlen=self._frame_bufsize)
-        self.Fluo_frame_buffers = [collections.deque(maxlen=self._frame_bufsize) for _ in range(N_NEURONS)]
+        self._frame_widx = 0
+        self.FrameTime_buffer = np.zeros(self._frame_bufsize, dtype=np.float64)
+        self.Fluo_frame_buffers = np.zeros((N_NEURONS, self._frame_bufsize), dtype=np.float32)
 
-        # Reset frame phase and spike refractory state
+        # Reset frame phase, spike refractory state and the previous Vm sample
         self._frame_phase_ms = 0.0
         self._t_last_spike_ms[:] = -1e12
+        self.VmData[:] = 0.0
 
-    def _append_buffers(self, t_ms):
-        """Append latest model states to rolling buffers."""
-        self.Time_buffer.append(float(t_ms))
-        self.Stim_buffer.append(float(self.StimData))
-        self.Trigger_buffer.append(float(self.TriggerData))
+    def _append_block(self, t, stim, trig, vm, ca, fluo):
+        """
+        Append M samples to the rolling buffers (t, stim, trig are (M,); vm, ca, fluo are (M, N_NEURONS)).
 
-        for i in range(N_NEURONS):
-            self.Calcium_buffers[i].append(float(self.CalciumData[i]))
-            self.Fluo_buffers[i].append(float(self.FluoData[i]))
-            self.Vm_buffers[i].append(float(self.VmData[i]))
+        The block is split in at most two slice assignments at the wrap-around seam;
+        if it is longer than the buffers only the newest samples are kept.
+        """
+        m = len(t)
+        if m > self._bufsize:
+            self._widx += m - self._bufsize
+            t, stim, trig = t[-self._bufsize:], stim[-self._bufsize:], trig[-self._bufsize:]
+            vm, ca, fluo = vm[-self._bufsize:], ca[-self._bufsize:], fluo[-self._bufsize:]
+            m = self._bufsize
+
+        i = self._widx % self._bufsize
+        first = min(m, self._bufsize - i)
+        rem = m - first
+        for buf, block in ((self.Time_buffer, t), (self.Stim_buffer, stim), (self.Trigger_buffer, trig)):
+            buf[i:i + first] = block[:first]
+            if rem:
+                buf[:rem] = block[first:]
+        for buf, block in ((self.Calcium_buffers, ca), (self.Fluo_buffers, fluo), (self.Vm_buffers, vm)):
+            buf[:, i:i + first] = block[:first].T
+            if rem:
+                buf[:, :rem] = block[first:].T
+        self._widx += m
+
+    def _unwrap(self, buf):
+        """Copy of a ring buffer (or of n rows of one), oldest sample first."""
+        i = self._widx % self._bufsize
+        return np.concatenate((buf[..., i:], buf[..., :i]), axis=-1)
+
+    def _frame_view(self):
+        """Frames held in the frame ring buffers, oldest first: (times (K,), fluo (N_NEURONS, K))."""
+        n = min(self._frame_widx, self._frame_bufsize)
+        i = self._frame_widx % self._frame_bufsize
+        order = np.arange(i - n, i) % self._frame_bufsize
+        return self.FrameTime_buffer[order], self.Fluo_frame_buffers[:, order]
+
+    def _unwrap_into(self, buf, out):
+        """Like _unwrap, but written into the preallocated array out (same shape as buf)."""
+        i = self._widx % self._bufsize
+        k = self._bufsize - i
+        out[..., :k] = buf[..., i:]
+        out[..., k:] = buf[..., :i]
+        return out
 
     # -------------------------------------------------------------------------
     # Plotting
@@ -1105,7 +1346,8 @@ class ImagingGraph(QObject):
         """
         pw = self.ui.Imaging_Oscilloscope_widget
         pw.clear()
-        pw.setAntialiasing(True)
+        # Thin cosmetic lines redrawn at ~60 Hz: antialiasing costs more than it shows
+        pw.setAntialiasing(False)
         pw.showGrid(x=True, y=True)
 
         pi = pw.getPlotItem()
@@ -1176,6 +1418,7 @@ class ImagingGraph(QObject):
         # Keep geometries aligned
         vb.sigResized.connect(self.update_views)
         vb.sigRangeChanged.connect(lambda *_: self.update_views())
+        self._views_rect = None
         self.update_views()
 
         # Curves
@@ -1216,17 +1459,45 @@ class ImagingGraph(QObject):
                                           pen=pg.mkPen(Settings.DarkSolarized[5], width=PEN_WIDTH, cosmetic=True))
         self.secondaryVB.addItem(self.Stimcurve)
 
+        # (curve, checkbox isChecked) pairs, one per neuron, resolved once for _update_plots
+        ui = self.ui
+        self._calcium_pairs = [(self.Calciumcurve1, ui.Imaging_Calcium1_Checkbox.isChecked),
+                               (self.Calciumcurve2, ui.Imaging_Calcium2_Checkbox.isChecked),
+                               (self.Calciumcurve3, ui.Imaging_Calcium3_Checkbox.isChecked)]
+        self._fluo_pairs = [(self.Fluocurve1, ui.Imaging_Fluorescence1_Checkbox.isChecked),
+                            (self.Fluocurve2, ui.Imaging_Fluorescence2_Checkbox.isChecked),
+                            (self.Fluocurve3, ui.Imaging_Fluorescence3_Checkbox.isChecked)]
+        self._vm_pairs = [(self.Vmcurve1, ui.Imaging_Vm1_Checkbox.isChecked),
+                          (self.Vmcurve2, ui.Imaging_Vm2_Checkbox.isChecked),
+                          (self.Vmcurve3, ui.Imaging_Vm3_Checkbox.isChecked)]
+        self._stim_pair = (self.Stimcurve, ui.Imaging_Stimulus_Checkbox.isChecked)
+        self._plot_pairs = self._calcium_pairs + self._fluo_pairs + self._vm_pairs + [self._stim_pair]
+        self._drawn_state = None
+
+        # Preallocated float32 plot arrays, refilled oldest-first in place by _update_plots
+        n = self._bufsize
+        self._plot_x = np.zeros(n, dtype=np.float32)
+        self._plot_ca = np.zeros((N_NEURONS, n), dtype=np.float32)
+        self._plot_fluo = np.zeros((N_NEURONS, n), dtype=np.float32)
+        self._plot_vm = np.zeros((N_NEURONS, n), dtype=np.float32)
+        self._plot_stim = np.zeros(n, dtype=np.float32)
+
         self._plots_ready = True
 
     def update_views(self):
         """
         Keep extra ViewBoxes aligned to the main ViewBox geometry.
-        This is called on resize/range changes.
+        This is called on resize/range changes; range changes (autoscale while streaming,
+        panning) leave the scene rect as it is, and the X range itself already follows
+        through setXLink, so nothing is redone unless the rect moved.
         """
         if self._mainVB is None:
             return
 
         rect = self._mainVB.sceneBoundingRect()
+        if rect == self._views_rect:
+            return
+        self._views_rect = rect
 
         if self.secondaryVB is not None:
             self.secondaryVB.setGeometry(rect)
@@ -1239,59 +1510,66 @@ class ImagingGraph(QObject):
     def _update_plots(self):
         """
         Update all plot curves based on checkbox visibility.
-        Buffers -> numpy arrays -> PyQtGraph curves.
+        Ring buffers -> preallocated float32 plot arrays (no per-draw allocation) -> PyQtGraph curves.
+
+        Skipped when no sample arrived and no curve visibility changed since the last redraw;
+        display-parameter changes (ΔF/F0, F0, offset, buffers, curves) reset _drawn_state to force one.
         """
-        ui = self.ui
-        t_arr = np.asarray(self.Time_buffer, dtype=float)
-        x = t_arr - t_arr[-1]  # last point at 0 ms, older negative
+        visible = [is_checked() for _, is_checked in self._plot_pairs]
+        state = (self._widx, visible)
+        if state == self._drawn_state:
+            return
+        self._drawn_state = state
 
-        # Calcium
-        calcium_checks = [ui.Imaging_Calcium1_Checkbox, ui.Imaging_Calcium2_Checkbox, ui.Imaging_Calcium3_Checkbox]
-        calcium_curves = [self.Calciumcurve1, self.Calciumcurve2, self.Calciumcurve3]
+        # Time axis: last point at 0 ms, older negative
+        n = self._bufsize
+        i = self._widx % n
+        k = n - i
+        x = self._plot_x
+        t_last = float(self.Time_buffer[i - 1])
+        np.subtract(self.Time_buffer[i:], t_last, out=x[:k])
+        np.subtract(self.Time_buffer[:i], t_last, out=x[k:])
 
-        for i in range(N_NEURONS):
-            visible = calcium_checks[i].isChecked()
-            calcium_curves[i].setVisible(visible)
-            if visible:
-                calcium_curves[i].setData(x, list(self.Calcium_buffers[i]))
+        # Calcium
+        self._draw_curves(self._calcium_pairs, visible[0:3], x, self.Calcium_buffers, self._plot_ca)
 
         # Fluorescence (or ΔF/F0)
-        fluo_checks = [ui.Imaging_Fluorescence1_Checkbox, ui.Imaging_Fluorescence2_Checkbox, ui.Imaging_Fluorescence3_Checkbox]
-        fluo_curves = [self.Fluocurve1, self.Fluocurve2, self.Fluocurve3]
-
-        for i in range(N_NEURONS):
-            visible = fluo_checks[i].isChecked()
-            fluo_curves[i].setVisible(visible)
-            if not visible:
-                continue
-
-            y = np.asarray(self.Fluo_buffers[i], dtype=float)
-
-            if self.use_dff:
-                # Offset-corrected ΔF/F0 (kept from your original approach)
-                offset = float(self._imaging_params.get("FluoOffset", 0.0))
-                y_sig = y - offset
-                f0_sig = float(self.F0[i]) - offset
-                f0_sig = max(1e-12, f0_sig)
-                y = 100 * (y_sig - f0_sig) / f0_sig
-
-            fluo_curves[i].setData(x, y)
+        dff = None
+        if self.use_dff:
+            offset = self._p_fluo_offset
+            dff = (offset, np.float32(max(self._F0_scalar - offset, 1e-12)))
+        self._draw_curves(self._fluo_pairs, visible[3:6], x, self.Fluo_buffers, self._plot_fluo, dff)
 
         # Vm
-        vm_checks = [ui.Imaging_Vm1_Checkbox, ui.Imaging_Vm2_Checkbox, ui.Imaging_Vm3_Checkbox]
-        vm_curves = [self.Vmcurve1, self.Vmcurve2, self.Vmcurve3]
-
-        for i in range(N_NEURONS):
-            visible = vm_checks[i].isChecked()
-            vm_curves[i].setVisible(visible)
-            if visible:
-                vm_curves[i].setData(x, list(self.Vm_buffers[i]))
+        self._draw_curves(self._vm_pairs, visible[6:9], x, self.Vm_buffers, self._plot_vm)
 
         # Stimulus
-        visible = ui.Imaging_Stimulus_Checkbox.isChecked()
-        self.Stimcurve.setVisible(visible)
-        if visible:
-            self.Stimcurve.setData(x, list(self.Stim_buffer))
+        self.Stimcurve.setVisible(visible[9])
+        if visible[9]:
+            self.Stimcurve.setData(x, self._unwrap_into(self.Stim_buffer, self._plot_stim), skipFiniteCheck=True)
+
+    def _draw_curves(self, pairs, visible, x, buffers, rows, dff=None) -> None:
+        """
+        Show/hide each (curve, isChecked) pair; only visible curves have their ring row
+        unrolled into the matching plot row and pushed. dff = (offset, f0_sig) converts
+        the row to ΔF/F0 in place first.
+        The buffers only ever hold finite values (scaled integer packets, clipped model
+        outputs), so pyqtgraph's per-draw NaN/inf scan is skipped.
+        """
+        for (curve, _), v, buf, y in zip(pairs, visible, buffers, rows):
+            curve.setVisible(v)
+            if not v:
+                continue
+            self._unwrap_into(buf, y)
+            if dff is not None:
+                # Offset-corrected ΔF/F0 (kept from your original approach), against the
+                # shared scalar baseline: y = 100 * (y - offset - f0_sig) / f0_sig
+                offset, f0_sig = dff
+                y -= offset
+                y -= f0_sig
+                y *= 100
+                y /= f0_sig
+            curve.setData(x, y, skipFiniteCheck=True)
 
     # -------------------------------------------------------------------------
     # Recording
@@ -1299,62 +1577,102 @@ class ImagingGraph(QObject):
 
     def _handle_recording(self):
         """
-        Manage record toggle and export on stop.
+        Manage record toggle: open the CSV on start, close it on stop.
 
         Behavior:
-          - When the record button transitions from checked -> unchecked, export CSV and clear.
-          - When checked, record_flag is True and samples are appended in _record_sample().
+          - When the record button transitions from unchecked -> checked, open the CSV and write the header.
+          - While recording, samples are appended in _record_block() and flushed to disk chunk by chunk.
+          - When the record button transitions from checked -> unchecked, flush the last rows and close the file.
         """
-        if (not self.ui.Imaging_DataRecording_Record_pushButton.isChecked()) and self.record_flag:
-            # Stop event -> export and reset
-            self._export_csv()
+        recording = self.ui.Imaging_DataRecording_Record_pushButton.isChecked()
+        if not recording and self.record_flag:
+            # Stop event -> write what is left and close
+            self._close_recording()
             self.record_flag = False
-            for k in self._rec:
-                self._rec[k].clear()
 
-        if self.ui.Imaging_DataRecording_Record_pushButton.isChecked():
-            self.record_flag = True
+        if recording and not self.record_flag:
+            self.record_flag = self._open_recording()
 
-    def _record_sample(self, t_ms: float) -> None:
-        """Append the latest sample to recording buffers (cheap list appends)."""
-        self._rec["t_ms"].append(float(t_ms))
-        self._rec["stim"].append(float(self.StimData))
-        self._rec["trig"].append(float(self.TriggerData))
-
-        self._rec["vm1"].append(float(self.VmData[0]))
-        self._rec["vm2"].append(float(self.VmData[1]))
-        self._rec["vm3"].append(float(self.VmData[2]))
-
-        self._rec["ca1_uM"].append(float(self.CalciumData[0]))
-        self._rec["ca2_uM"].append(float(self.CalciumData[1]))
-        self._rec["ca3_uM"].append(float(self.CalciumData[2]))
-
-        self._rec["F1"].append(float(self.FluoData[0]))
-        self._rec["F2"].append(float(self.FluoData[1]))
-        self._rec["F3"].append(float(self.FluoData[2]))
-
-    def _export_csv(self):
-        """Write recorded imaging data to CSV."""
-        if len(self._rec["t_ms"]) == 0:
+    def _open_recording(self) -> bool:
+        """Open the recording CSV and write the header row. Returns False (and unchecks Record) on failure."""
+        path = f"{self.ui.Imaging_SelectedFolderLabel.text()}.csv"
+        try:
+            self._rec_file = open(path, 'w', newline='', buffering=1 << 20)
+            self._rec_file.write(','.join(REC_COLUMNS) + '\n')
+        except Exception as e:
+            self._rec_file = None
+            self._recording_error(path, e)
+            self._stop_recording()
+            return False
+        self._rec_path = path
+        self._rec_head = 0
+        return True
+
+    def _stop_recording(self) -> None:
+        """End an active recording and release the Record button (disconnect, quit, open failure)."""
+        if self.record_flag:
+            self._close_recording()
+            self.record_flag = False
+        button = self.ui.Imaging_DataRecording_Record_pushButton
+        if button.isChecked():
+            # click() rather than setChecked(False), so RecordButton also restores the label/style
+            button.click()
+
+    def _record_block(self, t, stim, trig, vm, ca, fluo) -> None:
+        """Append a block of M samples to the recording buffer (vm, ca, fluo are (M, N_NEURONS))."""
+        m = len(t)
+        k = 0
+        while k < m:
+            n = min(m - k, REC_CHUNK - self._rec_head)
+            self._rec_t[self._rec_head:self._rec_head + n] = t[k:k + n]
+            rows = self._rec_buf[self._rec_head:self._rec_head + n]
+            rows[:, 0] = stim[k:k + n]
+            rows[:, 1] = trig[k:k + n]
+            rows[:, 2:5] = vm[k:k + n]
+            rows[:, 5:8] = ca[k:k + n]
+            rows[:, 8:11] = fluo[k:k + n]
+
+            k += n
+            self._rec_head += n
+            if self._rec_head == REC_CHUNK:
+                self._flush_recording()
+
+    def _flush_recording(self) -> None:
+        """Write the filled part of the recording chunk to the CSV and reuse the chunk."""
+        n = self._rec_head
+        self._rec_head = 0
+        if n == 0 or self._rec_file is None:
             return
+        # One (n, 12) matrix written straight from numpy: %.10g keeps long time stamps exact,
+        # %.7g prints the float32 signals at their own precision (no float64 round-off digits)
+        table = np.column_stack([self._rec_t[:n], self._rec_buf[:n]])
+        try:
+            np.savetxt(self._rec_file, table, delimiter=',', fmt=['%.10g'] + ['%.7g'] * (len(REC_COLUMNS) - 1))
+        except Exception as e:
+            # Stop writing to a broken file; the rows written so far stay on disk
+            rec_file, self._rec_file = self._rec_file, None
+            try:
+                rec_file.close()
+            except Exception:
+                pass
+            self._recording_error(self._rec_path, e)
 
-        df = pd.DataFrame({
-            "Time (ms)": self._rec["t_ms"],
-            "Stim": self._rec["stim"],
-            "Trigger": self._rec["trig"],
-            "Vm1 (mV)": self._rec["vm1"],
-            "Vm2 (mV)": self._rec["vm2"],
-            "Vm3 (mV)": self._rec["vm3"],
-            "Ca1 (uM)": self._rec["ca1_uM"],
-            "Ca2 (uM)": self._rec["ca2_uM"],
-            "Ca3 (uM)": self._rec["ca3_uM"],
-            "F1 (a.u.)": self._rec["F1"],
-            "F2 (a.u.)": self._rec["F2"],
-            "F3 (a.u.)": self._rec["F3"],
-        })
+    def _close_recording(self) -> None:
+        """Flush the remaining rows and close the recording CSV."""
+        self._flush_recording()
+        if self._rec_file is None:
+            return
+        try:
+            self._rec_file.close()
+        except Exception as e:
+            self._recording_error(self._rec_path, e)
+        self._rec_file = None
 
-        path = f"{self.ui.Imaging_SelectedFolderLabel.text()}.csv"
-        df.to_csv(path, index=False)
+    def _recording_error(self, path, e) -> None:
+        print(f"Failed to save data: {e}")
+        Settings.show_popup(self.parent,
+                            Title="Error saving file",
+                            Text=f"Could not save recording to {path}.\nError: {e}")
 
     # -------------------------------------------------------------------------
     # UI Helpers
@@ -1430,6 +1748,8 @@ class ImagingGraph(QObject):
             p["PMT_excess_noise_sigma"] = float(getattr(self, "pmt_excess_noise_sigma", 0.02))
             p["PMT_excess_noise_gamma"] = float(getattr(self, "pmt_excess_noise_gamma", 2.0))
 
+            self._refresh_param_cache()
+
             # If we are plotting ΔF/F, keep F0 synchronized with baseline settings
             if self.use_dff:
                 self._update_F0_from_baseline()
@@ -1526,7 +1846,7 @@ class ImagingGraph(QObject):
         self.IndicatorSat[:] = 0.0
 
         # Reset latest values
-        self.CalciumData[:] = float(self._imaging_params.get("CalciumBaseline", 0.1)) if self._imaging_params else 0.1
+        self.CalciumData[:] = self._p_Cb
         self.FluoData[:] = 0.0
         self.VmData[:] = 0.0
         self.StimData = 0.0
@@ -1534,4 +1854,7 @@ class ImagingGraph(QObject):
 
         if hasattr(self, "_rx_timer"):
             self._rx_timer.stop()
-        self._rx_queue.clear()
+        if hasattr(self, "_plot_timer"):
+            self._plot_timer.stop()
+        self._stop_recording()
+        self._rx_clear()
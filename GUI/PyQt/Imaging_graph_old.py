@@ -164,10 +164,10 @@ class ImagingGraph(QObject):
     # Data Entry Points
     # -------------------------------------------------------------------------
 
-    def on_data_received(self, data: list) -> None:
-        """Handle incoming hardware packets."""
+    def on_data_received(self, data) -> None:
+        """Handle an incoming (M, 8) batch of hardware packets."""
         if self.source_mode == "spikeling":
-            self._consume_vector(data)
+            self._consume_batch(data)
         else:
             return
 
@@ -11,11 +11,8 @@ from PySide6.QtGui import QPen
 import pyqtgraph as pg
 from pathlib import Path
 
-import collections
 import numpy as np
-import pandas as pd
 import struct
-from decimal import Decimal
 
 import Settings
 from serial_manager import serial_manager
@@ -32,6 +29,28 @@ VM_MIN = -100
 VM_MAX = 40
 CURRENT_MIN = -100
 CURRENT_MAX = 100
+NOISE_POOL_SIZE = 4096
+DRAW_INTERVAL = 16   # ms, ~60 Hz redraw
+IO_INTERVAL = 10     # ms, one custom stimulus sample / noise value per tick
+REC_INITIAL_CAPACITY = 1 << 16  # samples; the recording buffer doubles when full
+
+# Connect button stylesheets, built once at import
+_QSS_CONNECTED = (
+    f"color: rgb{tuple(Settings.DarkSolarized[3])};\n"
+    f"background-color: rgb{tuple(Settings.DarkSolarized[11])};\n"
+    f"border: 1px solid rgb{tuple(Settings.DarkSolarized[14])};\n"
+    f"border-radius: 10px;"
+)
+_QSS_DISCONNECTED = (
+    f"color: rgb{tuple(Settings.DarkSolarized[14])};\n"
+    f"background-color: rgb{tuple(Settings.DarkSolarized[2])};\n"
+    f"border: 1px solid rgb{tuple(Settings.DarkSolarized[14])};\n"
+    f"border-radius: 10px;"
+)
+
+# Curve pens, one per channel (Vm, Stimulus, InputCurrent, Syn1Vm, Syn1Input, Syn2Vm, Syn2Input)
+_PENS = [pg.mkPen(Settings.DarkSolarized[k], width=PEN_WIDTH, cosmetic=True)
+         for k in (3, 5, 4, 6, 7, 8, 10)]
 
 
 class SpikelingGraph(QObject):
@@ -47,9 +66,14 @@ class SpikelingGraph(QObject):
         self.ui = parent.ui
 
         # --- Data buffers (always exist, pre-filled with zeros) ---
+        # One (8, N) ring buffer, one row per channel; _widx counts written samples
         self._bufsize = int(TIME_WINDOW / SAMPLE_INTERVAL)
-        for i in range(8):
-            setattr(self, f"databuffer{i}", collections.deque([0.0] * self._bufsize, self._bufsize))
+        self._ring = np.zeros((8, self._bufsize), dtype=np.float32)
+        self._widx = 0
+
+        # Recording buffer: (8, capacity), first _rec_n columns hold the recorded samples
+        self._rec = np.empty((8, REC_INITIAL_CAPACITY), dtype=np.float64)
+        self._rec_n = 0
 
         # state
         self.data = [0.0] * 8
@@ -57,19 +81,55 @@ class SpikelingGraph(QObject):
         self.record_flag = False
         self.stim_counter = 0
         self.current_plots = None
-
+        self._current_save_path = None
+        self._initialized_buffers = False  # set once set_init_parameters has built x / Y
 
 
         # Set SerialFlag in parent for use in Page101
         self.parent.SerialFlag = False
 
-        # Initialize attributes that will be set later
-        self.df_Stim = None
-        self.df_yStim = None
-
-        # Timer for GUI updates
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_plot)
+        # Custom stimulus, set by Page_Spikeling_NeuronInterface when a file is loaded
+        self.ui.df_Stim = None
+        self.ui.df_yStim = None
+
+        # Playback cache: one pre-encoded SC1 command per stimulus sample, rebuilt
+        # when the toggle is switched on or a different stimulus is loaded
+        self._stim_on = self.ui.StimCus_toggleButton.isChecked()
+        self._stim_src = None
+        self._stim_cmds = []
+        self._stim_reset_at = 0
+        self.ui.StimCus_toggleButton.toggled.connect(self._set_stim_on)
+
+        # Noise: pre-generated standard normal pool, refilled when exhausted
+        self._rng = np.random.default_rng()
+        self._noise_pool = self._rng.standard_normal(NOISE_POOL_SIZE)
+        self._noise_idx = 0
+        self._noise_value = self.ui.Spikeling_Noise_slider.value()
+        self.ui.Spikeling_Noise_slider.valueChanged.connect(self._set_noise_value)
+
+        # Visibility checkboxes, in the same channel order as Y. Their state is
+        # mirrored into _channel_visible so plot_curve does not query Qt every tick.
+        self.checkboxes = [self.ui.Spikeling_VmCheckbox,
+                           self.ui.Spikeling_StimulusCheckbox,
+                           self.ui.Spikeling_InputCurrentCheckbox,
+                           self.ui.Spikeling_Syn1VmCheckbox,
+                           self.ui.Spikeling_Syn1InputCheckbox,
+                           self.ui.Spikeling_Syn2VmCheckbox,
+                           self.ui.Spikeling_Syn2InputCheckbox]
+        self._channel_visible = [checkbox.isChecked() for checkbox in self.checkboxes]
+        for k, checkbox in enumerate(self.checkboxes):
+            checkbox.toggled.connect(lambda checked, k=k: self._set_channel_visible(k, checked))
+
+        # Record button state, mirrored the same way for on_data_received / save_plot_data
+        self._recording = self.ui.Spikeling_DataRecording_Record_pushButton.isChecked()
+        self.ui.Spikeling_DataRecording_Record_pushButton.toggled.connect(self._set_recording)
+
+        # Timers: redraw at display rate, stimulus/noise/recording I/O on its own cadence.
+        # Incoming samples are buffered as they arrive in on_data_received.
+        self.draw_timer = QTimer()
+        self.draw_timer.timeout.connect(self.plot_curve)
+        self.io_timer = QTimer()
+        self.io_timer.timeout.connect(self.update_io)
 
         # Serial manager signals
         serial_manager.data_received.connect(self.on_data_received)
@@ -103,7 +163,8 @@ class SpikelingGraph(QObject):
         self.parent.SerialFlag = True
         self.stim_counter = 0
 
-        self.timer.start(10)  # update every 1ms
+        self.draw_timer.start(DRAW_INTERVAL)
+        self.io_timer.start(IO_INTERVAL)
 
     def disconnect_device(self):
         """Called when connect button is unchecked."""
@@ -116,12 +177,7 @@ class SpikelingGraph(QObject):
             serial_port.write('CON' + '\n')
 
         self.ui.Spikeling_ConnectButton.setText("Connect Spikeling Screen")
-        self.ui.Spikeling_ConnectButton.setStyleSheet(
-            f"color: rgb{tuple(Settings.DarkSolarized[14])};\n"
-            f"background-color: rgb{tuple(Settings.DarkSolarized[2])};\n"
-            f"border: 1px solid rgb{tuple(Settings.DarkSolarized[14])};\n"
-            f"border-radius: 10px;"
-        )
+        self.ui.Spikeling_ConnectButton.setStyleSheet(_QSS_DISCONNECTED)
 
     def on_connection_changed(self, is_connected: bool):
         """Handle serial manager connection state."""
@@ -139,45 +195,43 @@ class SpikelingGraph(QObject):
     # -------------------------------------------------------------------------
     # Data Handling
     # -------------------------------------------------------------------------
-    def on_data_received(self, data: list):
+    def on_data_received(self, data):
         """Slot for serial_manager.data_received signal.
 
-        Expects a list of 8 floats:
+        Expects an (M, 8) array of samples (or a single 8-value packet), columns:
         [Vm, stim_state, Itot, syn1_vm, Isyn1, syn2_vm, Isyn2, trigger]
         """
-        if not data or len(data) != 8:
+        if data is None:
             return
-
-        #self.data = data
-        self.last_valid_data = data
-
-        try:
-            values = [float(v) for v in data]
-        except ValueError:
+        data = np.atleast_2d(data)
+        if data.shape[1] != 8 or not len(data):
             return
 
-        # Push one sample into each buffer PER PACKET
-        for i, v in enumerate(values):
-            getattr(self, f"databuffer{i}").append(v)
+        self.last_valid_data = data[-1]
+        self._push_samples(data)
 
         # If recording, also store these values for CSV export
-        if self.ui.Spikeling_DataRecording_Record_pushButton.isChecked() and self.record_flag:
-            # spikeling_data[0] will be time (added on export)
-            for i, v in enumerate(values):
-                self.spikeling_data[i + 1].append(v)
+        if self._recording and self.record_flag:
+            # time is added on export
+            self._record_samples(data)
 
 
 
-    def update_plot(self):
-        """Main loop: called periodically by QTimer."""
+    def update_io(self):
+        """Recording state and device commands: called periodically by io_timer."""
+        if not self._initialized_buffers:
+            return
         try:
-            #self.buff_data() # Data are already pushed into databuffers in on_data_received
             self.save_plot_data()
-            self.plot_curve()
-            self.handle_custom_stimulus()
-            self.handle_noise()
+
+            # Commands for this tick are collected and sent in a single write
+            cmds = bytearray()
+            self.handle_custom_stimulus(cmds)
+            self.handle_noise(cmds)
+            if cmds:
+                serial_manager.write(bytes(cmds))
         except Exception as e:
-            print(f"Error in update_plot: {e}")
+            print(f"Error in update_io: {e}")
 
 
 
@@ -196,37 +250,27 @@ class SpikelingGraph(QObject):
         # Buffers for Vm, current and stimulus
         self._bufsize = int(TIME_WINDOW / SAMPLE_INTERVAL)
 
-        # Initialize data buffers
-        for i in range(8):
-            setattr(self, f"databuffer{i}", collections.deque([0.0] * self._bufsize, self._bufsize))
+        # Initialize ring buffer
+        self._ring = np.zeros((8, self._bufsize), dtype=np.float32)
+        self._widx = 0
 
-        # Numpy arrays for plotting
-        self.x = np.linspace(-TIME_WINDOW, 0.0, self._bufsize)
-        for i in range(7):
-            setattr(self, f"y{i}", np.zeros(self._bufsize, dtype=float))
+        # Numpy arrays for plotting: row k of Y is drawn by curves[k]
+        # x stays float64: clip-to-view searchsorts it on every redraw
+        self.x = np.linspace(-TIME_WINDOW, 0.0, self._bufsize, dtype=np.float64)
+        self.Y = np.zeros((7, self._bufsize), dtype=np.float32)
 
-        # Data recording arrays
-        self.spikeling_data = []
-        for _ in range(9):
-            self.spikeling_data.append([])
+        # Data recording buffer
+        self._rec_n = 0
 
         # Set button appearance
         if self.ui.Spikeling_ConnectButton.isChecked() and serial_manager.is_open:
             self.ui.Spikeling_ConnectButton.setText("Connected")
-            self.ui.Spikeling_ConnectButton.setStyleSheet(
-                f"color: rgb{tuple(Settings.DarkSolarized[3])};\n"
-                f"background-color: rgb{tuple(Settings.DarkSolarized[11])};\n"
-                f"border: 1px solid rgb{tuple(Settings.DarkSolarized[14])};\n"
-                f"border-radius: 10px;"
-            )
+            self.ui.Spikeling_ConnectButton.setStyleSheet(_QSS_CONNECTED)
         else:
             self.ui.Spikeling_ConnectButton.setText("Connect Spikeling Screen")
-            self.ui.Spikeling_ConnectButton.setStyleSheet(
-                f"color: rgb{tuple(Settings.DarkSolarized[14])};\n"
-                f"background-color: rgb{tuple(Settings.DarkSolarized[2])};\n"
-                f"border: 1px solid rgb{tuple(Settings.DarkSolarized[14])};\n"
-                f"border-radius: 10px;"
-            )
+            self.ui.Spikeling_ConnectButton.setStyleSheet(_QSS_DISCONNECTED)
+
+        self._initialized_buffers = True
 
 
 
@@ -235,16 +279,47 @@ class SpikelingGraph(QObject):
 # -------------------------------------------------------------------------
 
     def buff_data(self): #Legacy; not used anymore. Data is now appended in on_data_received().
-        try:
-            if not self.data or len(self.data) < 8:
-                values = [0.0] * 8
-            else:
-                values = [float(v) for v in self.data]
+        # Decoded packets are already numeric rows: use them as-is
+        if isinstance(self.data, np.ndarray) and self.data.shape == (8,):
+            values = self.data
+        else:
+            try:
+                values = np.fromiter((float(v) if v else 0.0 for v in self.data),
+                                     dtype=np.float32, count=8)
+            except (TypeError, ValueError):
+                values = np.zeros(8, dtype=np.float32)
 
-            for i, v in enumerate(values):
-                getattr(self, f"databuffer{i}").append(v)
-        except Exception as e:
-            print(f"Error in buff_data: {e}")
+        self._push_samples(values[np.newaxis, :])
+
+    def _push_samples(self, samples):
+        """
+        Write an (M, 8) block of samples into the ring buffer.
+
+        The block is split in at most two slice assignments at the wrap-around
+        seam; if it is longer than the ring only the newest samples are kept.
+        """
+        m = samples.shape[0]
+        if m > self._bufsize:
+            self._widx += m - self._bufsize
+            samples = samples[-self._bufsize:]
+            m = self._bufsize
+
+        i = self._widx % self._bufsize
+        first = min(m, self._bufsize - i)
+        self._ring[:, i:i + first] = samples[:first].T
+        rem = m - first
+        if rem:
+            self._ring[:, :rem] = samples[first:].T
+        self._widx += m
+
+    def _copy_channel(self, k, out):
+        """
+        Copy channel k of the ring buffer into out, oldest sample first.
+        """
+        i = self._widx % self._bufsize
+        n = self._bufsize - i
+        out[:n] = self._ring[k, i:]
+        out[n:] = self._ring[k, :i]
 
 
     def set_plot(self):
@@ -293,21 +368,21 @@ class SpikelingGraph(QObject):
         pw.getAxis("right").linkToView(self.current_plots) # Link the right axis to the secondary viewbox
 
         # Create plot curves for membrane potentials on the main plot with anti-aliasing
-        self.curve0 = self.ui.Spikeling_Oscilloscope_widget.plot(self.x, self.y0, pen=pg.mkPen(Settings.DarkSolarized[3], width=PEN_WIDTH, cosmetic=True))
+        self.curve0 = self.ui.Spikeling_Oscilloscope_widget.plot(self.x, self.Y[0], pen=_PENS[0])
         self.curve0.clear()
-        self.curve3 = self.ui.Spikeling_Oscilloscope_widget.plot(self.x, self.y3, pen=pg.mkPen(Settings.DarkSolarized[6], width=PEN_WIDTH, cosmetic=True))
+        self.curve3 = self.ui.Spikeling_Oscilloscope_widget.plot(self.x, self.Y[3], pen=_PENS[3])
         self.curve3.clear()
-        self.curve5 = self.ui.Spikeling_Oscilloscope_widget.plot(self.x, self.y5, pen=pg.mkPen(Settings.DarkSolarized[8], width=PEN_WIDTH, cosmetic=True))
+        self.curve5 = self.ui.Spikeling_Oscilloscope_widget.plot(self.x, self.Y[5], pen=_PENS[5])
         self.curve5.clear()
 
         # Create plot curves for currents and stimulus (secondary plot - right y-axis) with anti-aliasing
-        self.curve1 = pg.PlotCurveItem(self.x, self.y1, pen=pg.mkPen(Settings.DarkSolarized[5], width=PEN_WIDTH, cosmetic=True))
+        self.curve1 = pg.PlotDataItem(self.x, self.Y[1], pen=_PENS[1])
         self.curve1.clear()
-        self.curve2 = pg.PlotCurveItem(self.x, self.y2, pen=pg.mkPen(Settings.DarkSolarized[4], width=PEN_WIDTH, cosmetic=True))
+        self.curve2 = pg.PlotDataItem(self.x, self.Y[2], pen=_PENS[2])
         self.curve2.clear()
-        self.curve4 = pg.PlotCurveItem(self.x, self.y4, pen=pg.mkPen(Settings.DarkSolarized[7], width=PEN_WIDTH, cosmetic=True))
+        self.curve4 = pg.PlotDataItem(self.x, self.Y[4], pen=_PENS[4])
         self.curve4.clear()
-        self.curve6 = pg.PlotCurveItem(self.x, self.y6, pen=pg.mkPen(Settings.DarkSolarized[10], width=PEN_WIDTH, cosmetic=True))
+        self.curve6 = pg.PlotDataItem(self.x, self.Y[6], pen=_PENS[6])
         self.curve6.clear()
 
         # Add current and stimulus curves to the secondary plot (right y-axis)
@@ -316,6 +391,15 @@ class SpikelingGraph(QObject):
         self.current_plots.addItem(self.curve4)
         self.current_plots.addItem(self.curve6)
 
+        self.curves = [self.curve0, self.curve1, self.curve2, self.curve3,
+                       self.curve4, self.curve5, self.curve6]
+
+        # Only draw the visible time window, peak-downsampled to the screen resolution.
+        # 'peak' keeps each bin's min and max, so spikes survive the decimation.
+        for curve in self.curves:
+            curve.setDownsampling(auto=True, method='peak')
+            curve.setClipToView(True)
+
 
         # Update secondary ViewBox when main plot resizes
         def update_views():
@@ -331,66 +415,19 @@ class SpikelingGraph(QObject):
         """
         Update the plot curves with the latest data from buffers.
         """
+        if not self._initialized_buffers:
+            return
         try:
-            # Check if all required attributes are initialized
-            required_attrs = ['x', 'y0', 'y1', 'y2', 'y3', 'y4', 'y5', 'y6',
-                              'curve0', 'curve1', 'curve2', 'curve3', 'curve4', 'curve5', 'curve6',
-                             'databuffer0', 'databuffer1', 'databuffer2', 'databuffer3', 'databuffer4', 'databuffer5', 'databuffer6']
-
-
-            # Plot on the main plot
-            if self.ui.Spikeling_VmCheckbox.isChecked():
-                self.y0[:] = self.databuffer0
-                self.curve0.setData(self.x, self.y0)
-                self.curve0.setVisible(True)
-            else:
-                self.curve0.setVisible(False)
-
-            if self.ui.Spikeling_StimulusCheckbox.isChecked():
-                self.y1[:] = self.databuffer1
-                self.curve1.setData(self.x, self.y1)
-                self.curve1.setVisible(True)
-            else:
-                self.curve1.setVisible(False)
-
-            if self.ui.Spikeling_InputCurrentCheckbox.isChecked():
-                self.y2[:] = self.databuffer2
-                self.curve2.setData(self.x, self.y2)
-                self.curve2.setVisible(True)
-            else:
-                self.curve2.setVisible(False)
-
-            if self.ui.Spikeling_Syn1VmCheckbox.isChecked():
-                self.y3[:] = self.databuffer3
-                self.curve3.setData(self.x, self.y3)
-                self.curve3.setVisible(True)
-            else:
-                self.curve3.setVisible(False)
-
-            if self.ui.Spikeling_Syn1InputCheckbox.isChecked():
-                self.y4[:] = self.databuffer4
-                self.curve4.setData(self.x, self.y4)
-                self.curve4.setVisible(True)
-            else:
-                self.curve4.setVisible(False)
-
-            if self.ui.Spikeling_Syn2VmCheckbox.isChecked():
-                self.y5[:] = self.databuffer5
-                self.curve5.setData(self.x, self.y5)
-                self.curve5.setVisible(True)
-            else:
-                self.curve5.setVisible(False)
-
-            if self.ui.Spikeling_Syn2InputCheckbox.isChecked():
-                self.y6[:] = self.databuffer6
-                self.curve6.setData(self.x, self.y6)
-                self.curve6.setVisible(True)
-            else:
-                self.curve6.setVisible(False)
-
-            # Secondary ViewBox auto-syncs y-axis (current/stimulus)
-            self.current_plots.setGeometry(self.ui.Spikeling_Oscilloscope_widget.getViewBox().sceneBoundingRect())
+            for k, visible in enumerate(self._channel_visible):
+                curve = self.curves[k]
+                if visible:
+                    self._copy_channel(k, self.Y[k])
+                    curve.setData(self.x, self.Y[k])
+                    curve.setVisible(True)
+                else:
+                    curve.setVisible(False)
 
+            # The secondary ViewBox geometry is kept in sync by update_views on sigResized
 
         except Exception as e:
             print(f"Error in plot_curve: {e}")
@@ -408,7 +445,7 @@ class SpikelingGraph(QObject):
         Handles overwrite/rename/cancel before recording starts.
         """
         # --- If recording is starting ---
-        if self.ui.Spikeling_DataRecording_Record_pushButton.isChecked() and not self.record_flag:
+        if self._recording and not self.record_flag:
             FolderName = self.ui.Spikeling_DataRecording_SelectRecordFolder_label.text()
             FileName = self.ui.Spikeling_DataRecording_RecordFolder_value.text()
             folder = Path(FolderName)
@@ -442,31 +479,35 @@ class SpikelingGraph(QObject):
 
             # Start recording
             self.record_flag = True
-            if not hasattr(self, "spikeling_data") or not self.spikeling_data:
-                self.spikeling_data = [[] for _ in range(9)]
-            else:
-                for i in range(9):
-                    if not self.spikeling_data[i]:
-                        self.spikeling_data[i] = []
 
             # Save path for later use
             self._current_save_path = save_path
 
-        # # --- If recording is on, append latest buffer data ---
-        # if self.ui.Spikeling_DataRecording_Record_pushButton.isChecked():
-        #     for i in range(8):
-        #         buffer_name = f"databuffer{i}"
-        #         if hasattr(self, buffer_name) and getattr(self, buffer_name):
-        #             self.spikeling_data[i + 1].append(getattr(self, buffer_name)[-1])
-
         # --- If recording is stopped, export data ---
-        if not self.ui.Spikeling_DataRecording_Record_pushButton.isChecked() and self.record_flag:
-            if hasattr(self, "_current_save_path"):
+        if not self._recording and self.record_flag:
+            if self._current_save_path is not None:
                 self.export_data_to_csv(self._current_save_path)
             self.record_flag = False
-            # Clear data arrays
-            for i in range(9):
-                self.spikeling_data[i].clear()
+            # Clear recording buffer
+            self._rec_n = 0
+
+    def _record_samples(self, samples):
+        """
+        Append an (M, 8) block of samples to the recording buffer.
+
+        Capacity doubles when full, so appends are amortised O(1) per sample.
+        """
+        n = self._rec_n + samples.shape[0]
+        if n > self._rec.shape[1]:
+            capacity = self._rec.shape[1]
+            while capacity < n:
+                capacity *= 2
+            grown = np.empty((8, capacity), dtype=np.float64)
+            grown[:, :self._rec_n] = self._rec[:, :self._rec_n]
+            self._rec = grown
+
+        self._rec[:, self._rec_n:n] = samples.T
+        self._rec_n = n
 
     def export_data_to_csv(self, file_path: Path):
         """
@@ -475,37 +516,29 @@ class SpikelingGraph(QObject):
         Args:
             file_path (Path): Full path of the CSV file to save.
         """
-        if not hasattr(self, "spikeling_data") or not self.spikeling_data:
-            print("No data to save.")
-            return
-
-        # Create a numpy array for the dataset
-        dataset = np.empty([9, len(self.spikeling_data[1])], dtype=float)
-
-        # Fill the dataset with recorded data
-        _interval = Decimal(str(SAMPLE_INTERVAL))
-        for i in range(len(self.spikeling_data[1])):
-            dataset[0][i] = i * _interval  # Time
-            for j in range(1, 9):
-                dataset[j][i] = self.spikeling_data[j][i]
-
-        # Create a dictionary for pandas DataFrame
-        data_dict = {
-            'Time (ms)': dataset[0],
-            'Spikeling Vm (mV)': dataset[1],
-            'Stimulus (%)': dataset[2],
-            'Total Current Input (a.u.)': dataset[3],
-            'Synapse 1 Vm (mV)': dataset[4],
-            'Synapse 1 Input (a.u.)': dataset[5],
-            'Synapse 2 Vm (mV)': dataset[6],
-            'Synapse 2 Input (a.u.)': dataset[7],
-            'Trigger': dataset[8]
-        }
-
-        # Create DataFrame and save to CSV
-        df = pd.DataFrame(data_dict)
+        # Recorded channels, one row each: (8, N) view, no copy
+        n = self._rec_n
+        dataset = self._rec[:, :n]
+
+        # Time column; rounding keeps e.g. 0.3 rather than 0.30000000000000004 in the CSV
+        time_ms = np.round(np.arange(n, dtype=np.float64) * SAMPLE_INTERVAL, 6)
+
+        headers = ['Time (ms)',
+                   'Spikeling Vm (mV)',
+                   'Stimulus (%)',
+                   'Total Current Input (a.u.)',
+                   'Synapse 1 Vm (mV)',
+                   'Synapse 1 Input (a.u.)',
+                   'Synapse 2 Vm (mV)',
+                   'Synapse 2 Input (a.u.)',
+                   'Trigger']
+
+        # One (N, 9) matrix written straight from numpy; %.10g keeps long time stamps exact
+        table = np.column_stack((time_ms, dataset.T))
         try:
-            df.to_csv(file_path, index=False)
+            with open(file_path, 'w', newline='') as f:
+                f.write(','.join(headers) + '\n')
+                np.savetxt(f, table, delimiter=',', fmt='%.10g')
         except Exception as e:
             print(f"Failed to save data: {e}")
             Settings.show_popup(self.parent,
@@ -518,15 +551,15 @@ class SpikelingGraph(QObject):
 
     def cleanup(self):
         """Release resources."""
-        if self.timer.isActive():
-            self.timer.stop()
+        if self.draw_timer.isActive():
+            self.draw_timer.stop()
+        if self.io_timer.isActive():
+            self.io_timer.stop()
 
         self.last_valid_data = None
 
-        for i in range(8):
-            buf_name = f"databuffer{i}"
-            if hasattr(self, buf_name):
-                getattr(self, buf_name).clear()
+        self._ring.fill(0.0)
+        self._widx = 0
 
         self.ui.Spikeling_Oscilloscope_widget.clear()
         if self.current_plots:
@@ -540,76 +573,100 @@ class SpikelingGraph(QObject):
 # Handlers
 # -------------------------------------------------------------------------
 
-    def handle_custom_stimulus(self):
+    def handle_custom_stimulus(self, cmds: bytearray):
         """
         Handle custom stimulus if enabled.
+
+        Args:
+            cmds (bytearray): Pending device commands for this tick; appended to.
         """
         try:
-            if not hasattr(self.ui, 'StimCus_toggleButton'):
-                return
-
-            if self.ui.StimCus_toggleButton.isChecked():
-                try:
-                    # # Check if df_yStim and df_Stim are initialized
-                    if not hasattr(self, 'df_yStim') or self.ui.df_yStim is None or not hasattr(self, 'df_Stim') or self.ui.df_Stim is None:
-                        return
+            if self._stim_on:
+                # Nothing to play until a stimulus file has been loaded
+                if self.ui.df_yStim is None or self.ui.df_Stim is None:
+                    return
+                if self.ui.df_yStim is not self._stim_src:
+                    self._cache_stimulus()
 
-                    # Check if stim_counter is within bounds
-                    if self.stim_counter >= len(self.ui.df_yStim):
-                        self.stim_counter = 0
+                i = self.stim_counter
+                if i >= len(self._stim_cmds):
+                    i = 0
 
-                    self.stim_cus_value = self.ui.df_yStim[self.stim_counter]
+                if serial_manager.is_open:
+                    cmds += self._stim_cmds[i]
+                    i += 1
 
+                if i >= self._stim_reset_at:
+                    i = 0
                     if serial_manager.is_open:
-                        serial_manager.write(f'SC1 {self.stim_cus_value}\n')
-                        self.stim_counter += 1
-
-                    if self.stim_counter > len(self.ui.df_Stim) - 1:
-                        self.stim_counter = 0
-                        if serial_manager.is_open:
-                            serial_manager.write('TR\n')
-                except (AttributeError, IndexError) as e:
-                    # Handle case where df_yStim or df_Stim is not defined or index is out of range
-                    print(f"Error in handle_custom_stimulus: {e}")
+                        cmds += b'TR\n'
+                self.stim_counter = i
             else:
                 if serial_manager.is_open:
-                    serial_manager.write('SC0\n')
+                    cmds += b'SC0\n'
         except Exception as e:
             # Log the error but don't crash the application
             print(f"Error in handle_custom_stimulus: {e}")
 
 
-    def handle_noise(self):
+    def handle_noise(self, cmds: bytearray):
         """
         Generate and send a new noise value if noise is enabled.
 
         This function is called by the timer to continuously update the noise
         value sent to the device.
+
+        Args:
+            cmds (bytearray): Pending device commands for this tick; appended to.
         """
         try:
-            # Check if noise toggle button exists
-            if not hasattr(self.ui, 'Noise_toggleButton'):
-                return
-
             # Check if noise is enabled
             if self.ui.Noise_toggleButton.isChecked():
                 try:
-                    # Check if noise slider exists
-                    if not hasattr(self.ui, 'Spikeling_Noise_slider'):
-                        return
-
-                    # Get the current noise amplitude
-                    noise_value = self.ui.Spikeling_Noise_slider.value()
-
-                    # Generate a new random noise value
-                    noise = np.random.normal(0, noise_value / 2)
+                    # Draw the next sample from the pool, scaled to the current amplitude
+                    if self._noise_idx >= NOISE_POOL_SIZE:
+                        self._rng.standard_normal(out=self._noise_pool)
+                        self._noise_idx = 0
+                    noise = float(self._noise_pool[self._noise_idx]) * (self._noise_value / 2)
+                    self._noise_idx += 1
 
                     # Send the noise value to the device
                     if serial_manager.is_open:
-                        serial_manager.write(f'NO1 {noise}\n')
+                        cmds += f'NO1 {noise}\n'.encode()
                 except Exception as e:
                     # Log specific errors in noise generation
                     print(f"Error generating noise: {e}")
         except Exception as e:
             # Log the error but don't crash the application
-            print(f"Error in handle_noise: {e}")
\ No newline at end of file
+            print(f"Error in handle_noise: {e}")
+
+
+    def _set_channel_visible(self, k: int, checked: bool):
+        """Mirror the state of checkbox k so plot_curve can read it without a Qt call."""
+        self._channel_visible[k] = checked
+
+
+    def _set_noise_value(self, value: int):
+        """Cache the noise slider amplitude so handle_noise does not poll the widget."""
+        self._noise_value = value
+
+
+    def _set_stim_on(self, checked: bool):
+        """Mirror the custom stimulus toggle and restart playback from the first sample."""
+        self._stim_on = checked
+        if checked:
+            self.stim_counter = 0
+            if self.ui.df_yStim is not None:
+                self._cache_stimulus()
+
+
+    def _cache_stimulus(self):
+        """Pre-encode the SC1 command for every sample of the loaded stimulus."""
+        self._stim_src = self.ui.df_yStim
+        self._stim_cmds = [f'SC1 {value}\n'.encode() for value in np.asarray(self.ui.df_yStim).tolist()]
+        self._stim_reset_at = len(self.ui.df_Stim)
+
+
+    def _set_recording(self, checked: bool):
+        """Mirror the state of the record button so the I/O path can read it without a Qt call."""
+        self._recording = checked
@@ -6,11 +6,13 @@ across different components of the application.
 """
 
 from PySide6.QtSerialPort import QSerialPort, QSerialPortInfo
-from PySide6.QtCore import QObject, Signal, QByteArray, QMutex, QMutexLocker
+from PySide6.QtCore import (QObject, QThread, Signal, Slot, QByteArray, QMutex, QMutexLocker,
+                            QMetaObject, QCoreApplication, Qt, Q_ARG, Q_RETURN_ARG)
 from collections import deque
 
+import numpy as np
+
 import Settings
-import struct
 
 # Binary sample packet from Spikeling firmware
 SPIKELING_HEADER = b'\xAA\x55'
@@ -21,75 +23,50 @@ V_SCALE = 100.0
 I_SCALE = 100.0
 SYN_V_SCALE = 1.0
 
-class SerialPortManager(QObject):
+# One wire frame as a numpy record: header bytes, then the 8 int16 channels
+SPIKELING_FRAME_DTYPE = np.dtype([('header', 'u1', (SPIKELING_HEADER_LEN,)),
+                                  ('payload', '<i2', (SPIKELING_PACKET_SIZE // 2,))])
+assert SPIKELING_FRAME_DTYPE.itemsize == SPIKELING_FRAME_SIZE
+
+# Divisor applied to each int16 payload channel, in packet order
+CHANNEL_SCALE = np.array([V_SCALE, 1.0, I_SCALE, SYN_V_SCALE, I_SCALE, SYN_V_SCALE, I_SCALE, 1.0])
+
+class SerialWorker(QObject):
     """
-    Singleton class for managing serial port connections.
+    Owner of the QSerialPort, living in its own QThread.
 
-    This class ensures that only one serial port connection is active at a time
-    and provides methods for opening, closing, and communicating with the port.
-    It also handles asynchronous data acquisition using the readyRead signal.
+    Bytes are read and decoded here, off the GUI thread, so parsing never
+    competes with repaints. Decoded batches leave through data_received,
+    which Qt queues across to the GUI thread.
     """
 
     # Signals
     error_occurred = Signal(str)
-    connection_changed = Signal(bool)
-    data_received = Signal(list)  # Signal emitted when valid data is received
-
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(SerialPortManager, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    data_received = Signal(object)  # (M, 8) float array of samples decoded from one read
 
     def __init__(self):
-        if self._initialized:
-            return
-
         super().__init__()
-        self._serial_port = QSerialPort()
-        self._port_name = ""
-        self._baud_rate = Settings.BaudRate
+        # Parented so that moveToThread() carries the port along with the worker
+        self._serial_port = QSerialPort(self)
         self._buffer = bytearray()
         self._data_buffer = deque(maxlen=1000)  # Buffer for storing processed data
-        self._mutex = QMutex()  # Mutex for thread-safe access to the data buffer
+        self._mutex = QMutex()  # Guards _data_buffer / _last_valid_data, read from the GUI thread
         self._last_valid_data = None
-        self._initialized = True
 
         # Connect the readyRead signal to the data handler
         self._serial_port.readyRead.connect(self._handle_ready_read)
 
-    @property
-    def is_open(self):
-        """Check if the serial port is open."""
-        return self._serial_port.isOpen()
-
-    @property
-    def port_name(self):
-        """Get the current port name."""
-        return self._port_name
-
-    def configure_port(self, port_name):
-        """
-        Configure the serial port with the specified port name.
-
-        Args:
-            port_name (str): The name of the port to configure
-
-        Returns:
-            bool: True if configuration was successful, False otherwise
-        """
+    @Slot(str, int, result=bool)
+    def configure_port(self, port_name, baud_rate):
+        """Configure the serial port (see SerialPortManager.configure_port)."""
         try:
             # Close the port if it's already open
             if self._serial_port.isOpen():
                 self._serial_port.close()
 
-            self._port_name = port_name
-
             # Configure the port
-            self._serial_port.setPortName(self._port_name)
-            self._serial_port.setBaudRate(self._baud_rate)
+            self._serial_port.setPortName(port_name)
+            self._serial_port.setBaudRate(baud_rate)
             self._serial_port.setDataBits(QSerialPort.Data8)
             self._serial_port.setParity(QSerialPort.NoParity)
             self._serial_port.setStopBits(QSerialPort.OneStop)
@@ -101,78 +78,55 @@ class SerialPortManager(QObject):
             self.error_occurred.emit(f"Error configuring port: {str(e)}")
             return False
 
+    @Slot(result=bool)
     def open(self):
-        """
-        Open the serial port.
-
-        Returns:
-            bool: True if the port was successfully opened, False otherwise
-        """
-        if not self._port_name:
-            self.error_occurred.emit("No port selected")
-            return False
-
+        """Open the configured port for reading and writing."""
         try:
-            # Open the port
             if not self._serial_port.open(QSerialPort.ReadWrite):
-                error_msg = f"Failed to open port {self._port_name}: {self._serial_port.errorString()}"
+                error_msg = f"Failed to open port {self._serial_port.portName()}: {self._serial_port.errorString()}"
                 self.error_occurred.emit(error_msg)
                 return False
-
-            self.connection_changed.emit(True)
             return True
 
         except Exception as e:
             self.error_occurred.emit(f"Error opening port: {str(e)}")
             return False
 
+    @Slot(result=bool)
     def close(self):
-        """Close the serial port."""
+        """Close the port. Returns True if it was open."""
         if self._serial_port.isOpen():
             self._serial_port.close()
-            self.connection_changed.emit(False)
+            return True
+        return False
 
+    @Slot(QByteArray)
     def write(self, data):
-        """
-        Write data to the serial port.
-
-        Args:
-            data (str): The data to write to the port
-
-        Returns:
-            bool: True if the data was successfully written, False otherwise
-        """
+        """Write raw bytes to the port."""
         if not self._serial_port.isOpen():
-            return False
+            return
 
         try:
-            # Convert string to bytes and write to port
-            bytes_written = self._serial_port.write(data.encode('utf-8'))
-            return bytes_written > 0
+            self._serial_port.write(data)
 
         except Exception as e:
             self.error_occurred.emit(f"Error writing to port: {str(e)}")
-            return False
-
-    def _is_valid_number(self, value):
-        """
-        Check if a string can be converted to a float.
 
-        Args:
-            value (str): The string to check
+    @Slot(result=QByteArray)
+    def read_all(self):
+        """Read all bytes currently available on the port."""
+        return self._serial_port.readAll()
 
-        Returns:
-            bool: True if the string can be converted to a float, False otherwise
-        """
-        # Check if the string is just a minus sign
-        if value == '-':
-            return False
+    @Slot(result=int)
+    def bytes_available(self):
+        """Number of bytes available to read on the port."""
+        return self._serial_port.bytesAvailable()
 
-        try:
-            float(value)
-            return True
-        except ValueError:
-            return False
+    @Slot()
+    def clear_buffer(self):
+        """Drop undecoded bytes and the decoded sample history."""
+        self._buffer.clear()
+        self.clear_data_buffer()
 
     def _handle_ready_read(self):
         """
@@ -192,26 +146,6 @@ class SerialPortManager(QObject):
         except Exception as e:
             self.error_occurred.emit(f"Error processing serial data: {str(e)}")
 
-
-    def get_latest_data(self):
-        """
-        Get the latest valid data from the buffer.
-
-        Returns:
-            list: The latest valid data, or None if no valid data is available
-        """
-        # First try to read directly from the serial port
-        direct_data = self.read_and_process_data()
-        if direct_data:
-            return direct_data
-
-        # If direct read fails, return the last valid data from the buffer
-        with QMutexLocker(self._mutex):
-            if self._last_valid_data:
-                return self._last_valid_data.copy()
-            else:
-                return None
-
     def read_and_process_data(self):
         """
         Process the buffered binary serial data.
@@ -222,11 +156,15 @@ class SerialPortManager(QObject):
         SamplePacket payload (little-endian int16_t):
           v_q, stim_state, Itot_q, syn1_vm_q, Isyn1_q, syn2_vm_q, Isyn2_q, trigger_q
 
-        Emits data_received(list[float]) in this order:
+        All complete frames are decoded in one pass and emitted together as
+        data_received(ndarray) of shape (M, 8), columns in this order:
           [Vm, Stim, Itot, Syn1Vm, Syn1I, Syn2Vm, Syn2I, Trigger]
+
+        Returns:
+            list: The last decoded sample, or None if no complete frame was available
         """
         try:
-            last_packet = None
+            batches = []
 
             while True:
                 buf_len = len(self._buffer)
@@ -244,56 +182,228 @@ class SerialPortManager(QObject):
                         del self._buffer[:buf_len - SPIKELING_HEADER_LEN]
                     break
 
-                # We found a potential header at idx, but do we have the full frame?
-                if buf_len < idx + SPIKELING_FRAME_SIZE:
-                    # Wait for more bytes
-                    # Optionally drop junk before header
-                    if idx > 0:
-                        del self._buffer[:idx]
-                    break
-
-                # We have a full frame: drop any junk before header
+                # Drop any junk before header
                 if idx > 0:
                     del self._buffer[:idx]
                     buf_len = len(self._buffer)
 
-                # Now buffer starts with header; extract payload
-                # [0:2] = header, [2:18] = payload
-                payload = bytes(self._buffer[SPIKELING_HEADER_LEN:
-                                             SPIKELING_HEADER_LEN + SPIKELING_PACKET_SIZE])
+                # Wait for more bytes if the frame is incomplete
+                n_frames = buf_len // SPIKELING_FRAME_SIZE
+                if n_frames == 0:
+                    break
+
+                # View every complete frame as one record (header, payload)
+                frames = np.frombuffer(bytes(self._buffer[:n_frames * SPIKELING_FRAME_SIZE]),
+                                       dtype=SPIKELING_FRAME_DTYPE)
 
-                # Remove the whole frame from the buffer
-                del self._buffer[:SPIKELING_FRAME_SIZE]
+                # Keep the run of frames aligned on a header; resync on the next pass after that
+                header = frames['header']
+                misaligned = np.flatnonzero((header[:, 0] != SPIKELING_HEADER[0]) |
+                                            (header[:, 1] != SPIKELING_HEADER[1]))
+                n_good = int(misaligned[0]) if misaligned.size else n_frames
 
-                # Unpack payload:
-                v_q, stim_state_q, Itot_q, syn1_vm_q, Isyn1_q, syn2_vm_q, Isyn2_q, trigger_q = \
-                    struct.unpack('<hhhhhhhh', payload)
+                # Rescale straight from the strided int16 payload view
+                batches.append(frames['payload'][:n_good] / CHANNEL_SCALE)
 
-                # Rescale:
-                v = v_q / V_SCALE
-                stim = float(stim_state_q)
-                Itot = Itot_q / I_SCALE
-                syn1_vm = syn1_vm_q / SYN_V_SCALE
-                Isyn1 = Isyn1_q / I_SCALE
-                syn2_vm = syn2_vm_q / SYN_V_SCALE
-                Isyn2 = Isyn2_q / I_SCALE
-                trigger = float(trigger_q)
+                # Remove the decoded frames from the buffer
+                del self._buffer[:n_good * SPIKELING_FRAME_SIZE]
 
-                floats = [v, stim, Itot, syn1_vm, Isyn1, syn2_vm, Isyn2, trigger]
+            if not batches:
+                return None
 
-                with QMutexLocker(self._mutex):
-                    self._data_buffer.append(floats)
-                    self._last_valid_data = floats
+            samples = batches[0] if len(batches) == 1 else np.concatenate(batches)
+            last_packet = samples[-1].tolist()
 
-                self.data_received.emit(floats)
-                last_packet = floats
+            with QMutexLocker(self._mutex):
+                self._data_buffer.extend(samples[-self._data_buffer.maxlen:].tolist())
+                self._last_valid_data = last_packet
 
+            self.data_received.emit(samples)
             return last_packet
 
         except Exception as e:
             self.error_occurred.emit(f"Error processing buffered data: {str(e)}")
             return None
 
+    def get_last_valid_data(self):
+        """Thread-safe copy of the last decoded sample, or None."""
+        with QMutexLocker(self._mutex):
+            if self._last_valid_data:
+                return self._last_valid_data.copy()
+            else:
+                return None
+
+    def get_data_buffer(self):
+        """Thread-safe copy of the decoded sample history."""
+        with QMutexLocker(self._mutex):
+            return list(self._data_buffer)
+
+    def clear_data_buffer(self):
+        """Clear the decoded sample history."""
+        with QMutexLocker(self._mutex):
+            self._data_buffer.clear()
+            self._last_valid_data = None
+
+
+class SerialPortManager(QObject):
+    """
+    Singleton class for managing serial port connections.
+
+    This class ensures that only one serial port connection is active at a time
+    and provides methods for opening, closing, and communicating with the port.
+    The port itself is owned by a SerialWorker running in a dedicated QThread;
+    this class is the GUI-thread front end and forwards calls to it.
+    """
+
+    # Signals
+    error_occurred = Signal(str)
+    connection_changed = Signal(bool)
+    data_received = Signal(object)  # (M, 8) float array of samples decoded from one read
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SerialPortManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        super().__init__()
+        self._port_name = ""
+        self._baud_rate = Settings.BaudRate
+        self._is_open = False
+        self._worker = SerialWorker()
+        self._worker.error_occurred.connect(self.error_occurred)
+        self._worker.data_received.connect(self.data_received)
+        self._thread = None
+        self._initialized = True
+
+    def _ensure_thread(self):
+        """
+        Start the worker thread on first use.
+
+        Deferred until a QApplication exists (this module is imported before
+        one is created), so that the thread can be stopped on aboutToQuit.
+        """
+        if self._thread is not None:
+            return
+
+        self._thread = QThread()
+        self._thread.setObjectName("SerialWorker")
+        self._worker.moveToThread(self._thread)
+        self._thread.start()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def _call(self, method, return_type, *args):
+        """Run a worker slot in the worker thread and wait for its result."""
+        self._ensure_thread()
+        if return_type is None:
+            return QMetaObject.invokeMethod(self._worker, method, Qt.BlockingQueuedConnection, *args)
+        return QMetaObject.invokeMethod(self._worker, method, Qt.BlockingQueuedConnection,
+                                        Q_RETURN_ARG(return_type), *args)
+
+    def shutdown(self):
+        """Close the port and stop the worker thread."""
+        if self._thread is None:
+            return
+        self.close()
+        self._thread.quit()
+        self._thread.wait()
+        self._thread = None
+
+    @property
+    def is_open(self):
+        """Check if the serial port is open."""
+        return self._is_open
+
+    @property
+    def port_name(self):
+        """Get the current port name."""
+        return self._port_name
+
+    def configure_port(self, port_name):
+        """
+        Configure the serial port with the specified port name.
+
+        Args:
+            port_name (str): The name of the port to configure
+
+        Returns:
+            bool: True if configuration was successful, False otherwise
+        """
+        self._port_name = port_name
+        ok = self._call("configure_port", bool, Q_ARG(str, port_name), Q_ARG(int, self._baud_rate))
+        # configure_port closes an open port first, silently (connection_changed(False)
+        # is only emitted by close()); connect_device() opens it again right after
+        self._is_open = False
+        return ok
+
+    def open(self):
+        """
+        Open the serial port.
+
+        Returns:
+            bool: True if the port was successfully opened, False otherwise
+        """
+        if not self._port_name:
+            self.error_occurred.emit("No port selected")
+            return False
+
+        if not self._call("open", bool):
+            return False
+
+        self._is_open = True
+        self.connection_changed.emit(True)
+        return True
+
+    def close(self):
+        """Close the serial port."""
+        if self._thread is not None and self._call("close", bool):
+            self._is_open = False
+            self.connection_changed.emit(False)
+
+    def write(self, data):
+        """
+        Write data to the serial port.
+
+        The write is queued to the worker thread and returns immediately.
+
+        Args:
+            data (str | bytes): The data to write to the port; str is UTF-8 encoded
+
+        Returns:
+            bool: True if the data was queued for writing, False otherwise
+        """
+        if not self._is_open:
+            return False
+
+        try:
+            # Convert string to bytes and hand over to the worker thread
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            QMetaObject.invokeMethod(self._worker, "write", Qt.QueuedConnection,
+                                     Q_ARG(QByteArray, QByteArray(data)))
+            return len(data) > 0
+
+        except Exception as e:
+            self.error_occurred.emit(f"Error writing to port: {str(e)}")
+            return False
+
+    def get_latest_data(self):
+        """
+        Get the latest valid data decoded by the worker.
+
+        Returns:
+            list: The latest valid data, or None if no valid data is available
+        """
+        return self._worker.get_last_valid_data()
 
     def get_data_buffer(self):
         """
@@ -302,39 +412,38 @@ class SerialPortManager(QObject):
         Returns:
             list: A copy of the data buffer
         """
-        with QMutexLocker(self._mutex):
-            return list(self._data_buffer)
+        return self._worker.get_data_buffer()
 
     def clear_data_buffer(self):
         """
         Clear the data buffer.
         """
-        with QMutexLocker(self._mutex):
-            self._data_buffer.clear()
-            self._last_valid_data = None
+        self._worker.clear_data_buffer()
 
     def clear_buffer(self):
         """
         Clear the input buffer.
         """
-        self._buffer.clear()
-        self.clear_data_buffer()
+        if self._thread is None:
+            self._worker.clear_buffer()
+        else:
+            self._call("clear_buffer", None)
 
     def read_all(self):
         """
         Read all available data from the serial port.
 
-        This method is maintained for backward compatibility.
-        It's recommended to use the asynchronous approach with the readyRead signal instead.
+        This method is maintained for backward compatibility. Reading here
+        bypasses the worker's parser, so it is not recommended.
 
         Returns:
             bytes: The data read from the port, or None if an error occurred
         """
-        if not self._serial_port.isOpen():
+        if not self._is_open:
             return None
 
         try:
-            return self._serial_port.readAll().data()
+            return self._call("read_all", QByteArray).data()
 
         except Exception as e:
             self.error_occurred.emit(f"Error reading from port: {str(e)}")
@@ -345,24 +454,25 @@ class SerialPortManager(QObject):
         Get the number of bytes available to read from the serial port.
 
         This method is maintained for backward compatibility.
-        It's recommended to use the asynchronous approach with the readyRead signal instead.
 
         Returns:
             int: The number of bytes available, or 0 if the port is not open
         """
-        if not self._serial_port.isOpen():
+        if not self._is_open:
             return 0
 
-        return self._serial_port.bytesAvailable()
+        return self._call("bytes_available", int)
 
     def get_serial_port(self):
         """
         Get the underlying QSerialPort object.
 
+        The port lives in the worker thread; only use it from there.
+
         Returns:
             QSerialPort: The serial port object
         """
-        return self._serial_port
+        return self._worker._serial_port
 
 
 # Create a global instance of the serial port manager